@@ -1,12 +1,13 @@
 """API routes for the RPC Benchmarker."""
 
+import asyncio
 import csv
-import hashlib
 import io
 import json
 import random
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 
 import httpx
 from fastapi import APIRouter, HTTPException, Query, Response, UploadFile, File
@@ -15,39 +16,52 @@ from sse_starlette.sse import EventSourceResponse
 
 from ..core.config import settings
 from ..core.database import get_db
+from ..core.http import get_rpc_client
+from ..core.serialization import (
+    JSONDecodeError,
+    encode_rpc_request,
+    json_dumps_bytes,
+    json_loads,
+    json_loads_async,
+)
 from ..models import (
     BenchmarkConfig,
     ChainConfig,
+    IterationType,
     JobCreate,
     ProviderValidationRequest,
     ProviderValidationResponse,
+    SSEEvent,
+    TestCategory,
+    TestLabel,
     TestParams,
 )
-from ..services import ChainService, BenchmarkService, get_test_definitions, build_test_cases
+from ..services import BenchmarkService, chain_service, get_test_definitions, build_test_cases
 
 router = APIRouter()
-chain_service = ChainService()
 benchmark_service = BenchmarkService()
 
+# Dedicated RNG for parameter randomization (seeded once from OS entropy)
+_rng = random.Random()
+
 
 # ============================================================================
 # Chain Configuration Endpoints
 # ============================================================================
 
 @router.get("/chains")
-async def list_chains() -> list[dict[str, Any]]:
+async def list_chains() -> Response:
     """List all chain configurations."""
-    chains = chain_service.list_chains()
-    return [c.model_dump(mode="json") for c in chains]
+    return Response(content=chain_service.list_chains_json(), media_type="application/json")
 
 
 @router.get("/chains/{chain_id}")
-async def get_chain(chain_id: int) -> dict[str, Any]:
+async def get_chain(chain_id: int) -> Response:
     """Get a chain configuration by ID."""
     chain = chain_service.get_chain(chain_id)
     if chain is None:
-        raise HTTPException(status_code=404, detail=f"Chain {chain_id} not found")
-    return chain.model_dump(mode="json")
+        return _not_found(f"Chain {chain_id} not found")
+    return _json_response(chain.model_dump(mode="json"))
 
 
 @router.post("/chains")
@@ -60,12 +74,12 @@ async def create_chain(chain_data: dict[str, Any]) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.put("/chains/{chain_id}")
-async def update_chain(chain_id: int, updates: dict[str, Any]) -> dict[str, Any]:
+@router.put("/chains/{chain_id}", response_model=None)
+async def update_chain(chain_id: int, updates: dict[str, Any]) -> dict[str, Any] | Response:
     """Update a chain configuration."""
     chain = chain_service.update_chain(chain_id, updates)
     if chain is None:
-        raise HTTPException(status_code=404, detail=f"Chain {chain_id} not found")
+        return _not_found(f"Chain {chain_id} not found")
     return chain.model_dump(mode="json")
 
 
@@ -87,65 +101,72 @@ async def delete_chain(chain_id: int) -> dict[str, str]:
 @router.post("/providers/validate")
 async def validate_providers(request: ProviderValidationRequest) -> ProviderValidationResponse:
     """Validate provider URLs return the expected chain ID."""
-    results = []
+    client = get_rpc_client()
 
-    async with httpx.AsyncClient() as client:
-        for url in request.urls:
-            try:
-                response = await client.post(
-                    url,
-                    json={"jsonrpc": "2.0", "method": "eth_chainId", "params": [], "id": 1},
-                    timeout=10,
-                )
-                data = response.json()
-                chain_id = int(data.get("result", "0x0"), 16)
-                valid = chain_id == request.expected_chain_id
-                results.append({
-                    "url": _mask_url(url),
-                    "valid": valid,
-                    "chain_id": chain_id,
-                    "expected_chain_id": request.expected_chain_id,
-                })
-            except Exception as e:
-                results.append({
-                    "url": _mask_url(url),
-                    "valid": False,
-                    "error": str(e),
-                })
+    # Validate all providers concurrently
+    results = await asyncio.gather(*[
+        _validate_one(client, url, request.expected_chain_id)
+        for url in request.urls
+    ])
 
     all_valid = all(r.get("valid", False) for r in results)
-    return ProviderValidationResponse(valid=all_valid, results=results)
+    return ProviderValidationResponse(valid=all_valid, results=list(results))
+
+
+async def _validate_one(
+    client: httpx.AsyncClient, url: str, expected_chain_id: int
+) -> dict[str, Any]:
+    """Validate a single provider URL returns the expected chain ID."""
+    try:
+        data = await _post_rpc(client, url, encode_rpc_request("eth_chainId"), timeout=10)
+        chain_id = _hex_to_int(data.get("result") or "0x0")
+        return {
+            "url": _mask_url(url),
+            "valid": chain_id == expected_chain_id,
+            "chain_id": chain_id,
+            "expected_chain_id": expected_chain_id,
+        }
+    except Exception as e:
+        return {
+            "url": _mask_url(url),
+            "valid": False,
+            "error": str(e),
+        }
 
 
 # ============================================================================
 # Test Parameters
 # ============================================================================
 
+# Test definitions are static, so serialize them once at import time
+_TEST_DEFINITIONS_JSON = json_dumps_bytes(get_test_definitions())
+
+
 @router.get("/test-cases")
-async def list_test_cases() -> list[dict[str, Any]]:
+async def list_test_cases() -> Response:
     """List all available test case definitions."""
-    return get_test_definitions()
+    return Response(content=_TEST_DEFINITIONS_JSON, media_type="application/json")
 
 
-@router.post("/params/randomize")
-async def randomize_params(chain_id: int = Query(...)) -> dict[str, Any]:
+@router.post("/params/randomize", response_model=None)
+async def randomize_params(chain_id: int = Query(...)) -> dict[str, Any] | Response:
     """Generate random valid test parameters for a chain."""
     chain = chain_service.get_chain(chain_id)
     if chain is None:
-        raise HTTPException(status_code=404, detail=f"Chain {chain_id} not found")
+        return _not_found(f"Chain {chain_id} not found")
 
     # Pick random values from chain config
-    test_address = random.choice(chain.test_addresses) if chain.test_addresses else None
-    token = random.choice(chain.token_contracts) if chain.token_contracts else None
+    test_address = _rng.choice(chain.test_addresses) if chain.test_addresses else None
+    token = _rng.choice(chain.token_contracts) if chain.token_contracts else None
 
     # Random archival block in range
-    archival_block = random.randint(
+    archival_block = _rng.randint(
         chain.archival_block_range[0],
         chain.archival_block_range[1]
     )
 
     # Pick random transaction
-    tx_hash = random.choice(chain.transaction_pool) if chain.transaction_pool else None
+    tx_hash = _rng.choice(chain.transaction_pool) if chain.transaction_pool else None
 
     params = {
         "known_address": test_address.address if test_address else "0x" + "0" * 40,
@@ -180,212 +201,196 @@ async def validate_params(
     # ERC20 Transfer event topic
     transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
 
-    async with httpx.AsyncClient() as client:
-        # Get current block number first
-        current_block = 0
+    client = get_rpc_client()
+    known_address = params.get("known_address", "")
+    logs_contract = params.get("logs_token_contract", "")
+    archival_block = params.get("archival_block", 0)
+
+    # Phase 1: independent lookups sent as a single JSON-RPC batch
+    phase1_calls = {"block": ("eth_blockNumber", [])}
+    if known_address:
+        phase1_calls["balance"] = ("eth_getBalance", [known_address, "latest"])
+    if logs_contract:
+        phase1_calls["code"] = ("eth_getCode", [logs_contract, "latest"])
+    phase1 = await _rpc_batch(client, provider_url, phase1_calls)
+    block_data = phase1["block"]
+    balance_data = phase1.get("balance")
+    code_data = phase1.get("code")
+
+    # Current block number
+    current_block = 0
+    try:
+        if isinstance(block_data, Exception):
+            raise block_data
+        current_block = _hex_to_int(block_data.get("result") or "0x0")
+    except Exception:
+        pass
+
+    # Phase 2: lookups that depend on the current block
+    has_code = (
+        isinstance(code_data, dict)
+        and "error" not in code_data
+        and code_data.get("result", "0x") not in ("0x", "0x0")
+    )
+    check_logs = has_code and current_block > 0
+    check_archival_code = bool(logs_contract) and bool(archival_block) and archival_block > 0 and current_block > 0
+    phase2_calls = {}
+    if check_logs:
+        phase2_calls["logs"] = ("eth_getLogs", [{
+            "address": logs_contract,
+            "fromBlock": hex(max(0, current_block - 1000)),
+            "toBlock": hex(current_block),
+            "topics": [transfer_topic],
+        }])
+    if check_archival_code:
+        phase2_calls["archival_code"] = ("eth_getCode", [logs_contract, hex(archival_block)])
+    phase2 = {}
+    if phase2_calls:
+        phase2 = await _rpc_batch(
+            client, provider_url, phase2_calls, timeout=15, max_bytes=MAX_LOGS_RESPONSE_BYTES
+        )
+    logs_data = phase2.get("logs")
+    archival_code_data = phase2.get("archival_code")
+
+    # Validate known address has balance
+    if known_address:
         try:
-            response = await client.post(
-                provider_url,
-                json={"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1},
-                timeout=10,
-            )
-            data = response.json()
-            current_block = int(data.get("result", "0x0"), 16)
-        except Exception:
-            pass
-
-        # Validate known address has balance
-        known_address = params.get("known_address", "")
-        if known_address:
-            try:
-                response = await client.post(
-                    provider_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "method": "eth_getBalance",
-                        "params": [known_address, "latest"],
-                        "id": 1,
-                    },
-                    timeout=10,
-                )
-                data = response.json()
-                if "error" in data:
-                    validation_results.append({
-                        "field": "known_address",
-                        "valid": False,
-                        "message": f"Invalid address: {data['error'].get('message', 'unknown error')}",
-                    })
-                else:
-                    has_balance = int(data.get("result", "0x0"), 16) > 0
-                    validation_results.append({
-                        "field": "known_address",
-                        "valid": has_balance,
-                        "message": "Address has balance" if has_balance else "Address has no balance (may cause test failures)",
-                    })
-            except Exception as e:
+            if isinstance(balance_data, Exception):
+                raise balance_data
+            if "error" in balance_data:
                 validation_results.append({
                     "field": "known_address",
                     "valid": False,
-                    "message": str(e),
+                    "message": f"Invalid address: {balance_data['error'].get('message', 'unknown error')}",
                 })
-        else:
+            else:
+                has_balance = _hex_to_int(balance_data.get("result") or "0x0") > 0
+                validation_results.append({
+                    "field": "known_address",
+                    "valid": has_balance,
+                    "message": "Address has balance" if has_balance else "Address has no balance (may cause test failures)",
+                })
+        except Exception as e:
             validation_results.append({
                 "field": "known_address",
                 "valid": False,
-                "message": "Address is required",
+                "message": str(e),
             })
-
-        # Validate logs_token_contract is a valid contract with Transfer events
-        logs_contract = params.get("logs_token_contract", "")
-        if logs_contract:
-            try:
-                # First check if it's a contract (has code)
-                response = await client.post(
-                    provider_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "method": "eth_getCode",
-                        "params": [logs_contract, "latest"],
-                        "id": 1,
-                    },
-                    timeout=10,
-                )
-                data = response.json()
-                if "error" in data:
+    else:
+        validation_results.append({
+            "field": "known_address",
+            "valid": False,
+            "message": "Address is required",
+        })
+
+    # Validate logs_token_contract is a valid contract with Transfer events
+    if logs_contract:
+        try:
+            if isinstance(code_data, Exception):
+                raise code_data
+            if "error" in code_data:
+                validation_results.append({
+                    "field": "logs_token_contract",
+                    "valid": False,
+                    "message": f"Invalid address: {code_data['error'].get('message', 'unknown error')}",
+                })
+            elif not has_code:
+                validation_results.append({
+                    "field": "logs_token_contract",
+                    "valid": False,
+                    "message": "Address is not a contract (no code)",
+                })
+            elif check_logs:
+                # Check if contract has recent Transfer events
+                if isinstance(logs_data, Exception):
+                    raise logs_data
+                if "error" in logs_data:
                     validation_results.append({
                         "field": "logs_token_contract",
                         "valid": False,
-                        "message": f"Invalid address: {data['error'].get('message', 'unknown error')}",
+                        "message": f"getLogs failed: {logs_data['error'].get('message', 'unknown error')}",
                     })
                 else:
-                    code = data.get("result", "0x")
-                    if code == "0x" or code == "0x0":
+                    logs = logs_data.get("result", [])
+                    if len(logs) > 0:
                         validation_results.append({
                             "field": "logs_token_contract",
-                            "valid": False,
-                            "message": "Address is not a contract (no code)",
+                            "valid": True,
+                            "message": f"Contract has {len(logs)} Transfer events in last 1000 blocks",
                         })
                     else:
-                        # Check if contract has recent Transfer events
-                        if current_block > 0:
-                            from_block = hex(max(0, current_block - 1000))
-                            to_block = hex(current_block)
-                            response = await client.post(
-                                provider_url,
-                                json={
-                                    "jsonrpc": "2.0",
-                                    "method": "eth_getLogs",
-                                    "params": [{
-                                        "address": logs_contract,
-                                        "fromBlock": from_block,
-                                        "toBlock": to_block,
-                                        "topics": [transfer_topic],
-                                    }],
-                                    "id": 1,
-                                },
-                                timeout=15,
-                            )
-                            data = response.json()
-                            if "error" in data:
-                                validation_results.append({
-                                    "field": "logs_token_contract",
-                                    "valid": False,
-                                    "message": f"getLogs failed: {data['error'].get('message', 'unknown error')}",
-                                })
-                            else:
-                                logs = data.get("result", [])
-                                if len(logs) > 0:
-                                    validation_results.append({
-                                        "field": "logs_token_contract",
-                                        "valid": True,
-                                        "message": f"Contract has {len(logs)} Transfer events in last 1000 blocks",
-                                    })
-                                else:
-                                    validation_results.append({
-                                        "field": "logs_token_contract",
-                                        "valid": False,
-                                        "message": "No Transfer events found in last 1000 blocks (may not be an ERC20 or low activity)",
-                                    })
-                        else:
-                            validation_results.append({
-                                "field": "logs_token_contract",
-                                "valid": True,
-                                "message": "Contract exists (could not verify Transfer events)",
-                            })
-            except Exception as e:
+                        validation_results.append({
+                            "field": "logs_token_contract",
+                            "valid": False,
+                            "message": "No Transfer events found in last 1000 blocks (may not be an ERC20 or low activity)",
+                        })
+            else:
                 validation_results.append({
                     "field": "logs_token_contract",
-                    "valid": False,
-                    "message": str(e),
+                    "valid": True,
+                    "message": "Contract exists (could not verify Transfer events)",
                 })
-        else:
+        except Exception as e:
             validation_results.append({
                 "field": "logs_token_contract",
                 "valid": False,
-                "message": "Token contract is required for getLogs tests",
+                "message": str(e),
+            })
+    else:
+        validation_results.append({
+            "field": "logs_token_contract",
+            "valid": False,
+            "message": "Token contract is required for getLogs tests",
+        })
+
+    # Validate archival block is reasonable
+    if archival_block and current_block > 0:
+        if archival_block > current_block:
+            validation_results.append({
+                "field": "archival_block",
+                "valid": False,
+                "message": f"Archival block {archival_block} is in the future (current: {current_block})",
+            })
+        elif archival_block < 1:
+            validation_results.append({
+                "field": "archival_block",
+                "valid": False,
+                "message": "Archival block must be greater than 0",
+            })
+        else:
+            validation_results.append({
+                "field": "archival_block",
+                "valid": True,
+                "message": f"Archival block {archival_block} is valid",
             })
 
-        # Validate archival block is reasonable
-        archival_block = params.get("archival_block", 0)
-        if archival_block and current_block > 0:
-            if archival_block > current_block:
+        # Check that token contract existed at archival block (if both are provided)
+        if check_archival_code:
+            if isinstance(archival_code_data, Exception):
                 validation_results.append({
                     "field": "archival_block",
                     "valid": False,
-                    "message": f"Archival block {archival_block} is in the future (current: {current_block})",
+                    "message": f"Failed to check contract at archival block: {str(archival_code_data)}",
                 })
-            elif archival_block < 1:
+            elif "error" in archival_code_data:
                 validation_results.append({
                     "field": "archival_block",
                     "valid": False,
-                    "message": "Archival block must be greater than 0",
+                    "message": f"Could not verify contract at archival block: {archival_code_data['error'].get('message', '')}",
                 })
             else:
-                validation_results.append({
-                    "field": "archival_block",
-                    "valid": True,
-                    "message": f"Archival block {archival_block} is valid",
-                })
-
-            # Check that token contract existed at archival block (if both are provided)
-            if logs_contract and archival_block > 0:
-                try:
-                    response = await client.post(
-                        provider_url,
-                        json={
-                            "jsonrpc": "2.0",
-                            "method": "eth_getCode",
-                            "params": [logs_contract, hex(archival_block)],
-                            "id": 1,
-                        },
-                        timeout=10,
-                    )
-                    data = response.json()
-                    if "error" in data:
-                        validation_results.append({
-                            "field": "archival_block",
-                            "valid": False,
-                            "message": f"Could not verify contract at archival block: {data['error'].get('message', '')}",
-                        })
-                    else:
-                        code = data.get("result", "0x")
-                        if code == "0x" or code == "0x0":
-                            validation_results.append({
-                                "field": "archival_block",
-                                "valid": False,
-                                "message": f"Token contract was not deployed at block {archival_block}. Choose a later block.",
-                            })
-                        else:
-                            validation_results.append({
-                                "field": "archival_block",
-                                "valid": True,
-                                "message": f"Token contract existed at archival block {archival_block}",
-                            })
-                except Exception as e:
+                code = archival_code_data.get("result", "0x")
+                if code == "0x" or code == "0x0":
                     validation_results.append({
                         "field": "archival_block",
                         "valid": False,
-                        "message": f"Failed to check contract at archival block: {str(e)}",
+                        "message": f"Token contract was not deployed at block {archival_block}. Choose a later block.",
+                    })
+                else:
+                    validation_results.append({
+                        "field": "archival_block",
+                        "valid": True,
+                        "message": f"Token contract existed at archival block {archival_block}",
                     })
 
     all_valid = all(r["valid"] for r in validation_results)
@@ -414,53 +419,40 @@ async def create_job(job_data: JobCreate) -> dict[str, Any]:
 async def list_jobs(
     chain_id: int | None = Query(None),
     limit: int = Query(100, le=1000),
-) -> list[dict[str, Any]]:
+) -> Response:
     """List all jobs, optionally filtered by chain."""
     db = await get_db()
-    jobs = await db.list_jobs(chain_id=chain_id, limit=limit)
-
-    # Parse config JSON
-    for job in jobs:
-        if isinstance(job.get("config_json"), str):
-            job["config"] = json.loads(job["config_json"])
-        else:
-            job["config"] = job.get("config_json", {})
-
-    return jobs
+    return _json_response(await db.list_jobs(chain_id=chain_id, limit=limit))
 
 
 @router.get("/jobs/{job_id}")
-async def get_job(job_id: str) -> dict[str, Any]:
+async def get_job(job_id: str) -> Response:
     """Get a job by ID."""
     job = await benchmark_service.get_job(job_id)
     if job is None:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
-
-    # Parse config JSON
-    if isinstance(job.get("config_json"), str):
-        job["config"] = json.loads(job["config_json"])
+        return _not_found(f"Job {job_id} not found")
 
-    return job
+    return _json_response(job)
 
 
 @router.get("/jobs/{job_id}/results")
-async def get_job_results(job_id: str) -> dict[str, Any]:
+async def get_job_results(job_id: str) -> Response:
     """Get results for a job."""
     db = await get_db()
     job = await db.get_job(job_id)
     if job is None:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return _not_found(f"Job {job_id} not found")
 
     results = await benchmark_service.get_job_results(job_id)
-    return results
+    return _json_response(results)
 
 
-@router.delete("/jobs/{job_id}")
-async def delete_job(job_id: str) -> dict[str, str]:
+@router.delete("/jobs/{job_id}", response_model=None)
+async def delete_job(job_id: str) -> dict[str, str] | Response:
     """Delete a job and all related data."""
     db = await get_db()
     if not await db.delete_job(job_id):
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return _not_found(f"Job {job_id} not found")
     return {"status": "deleted"}
 
 
@@ -480,13 +472,19 @@ async def cancel_job(job_id: str) -> dict[str, str]:
 async def job_progress(job_id: str):
     """Stream job progress via Server-Sent Events."""
     async def event_generator():
-        async for event in benchmark_service.run_job(job_id):
-            yield {
-                "event": event.event,
-                "data": json.dumps(event.data),
-            }
-
-    return EventSourceResponse(event_generator())
+        events = _coalesce_progress(benchmark_service.run_job(job_id), settings.sse_coalesce_ms)
+        async for event in events:
+            yield _encode_sse(event.event, event.data)
+
+    return EventSourceResponse(
+        event_generator(),
+        ping=settings.sse_ping_seconds,
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 # ============================================================================
@@ -499,23 +497,19 @@ async def export_json(job_id: str) -> Response:
     db = await get_db()
     job = await db.get_job(job_id)
     if job is None:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return _not_found(f"Job {job_id} not found")
 
     providers = await db.get_job_providers(job_id)
     test_params = await db.get_job_test_params(job_id)
     tests_executed = await db.get_job_tests_executed(job_id)
     results = await benchmark_service.get_job_results(job_id)
-
-    # Parse config
-    config = job.get("config_json", {})
-    if isinstance(config, str):
-        config = json.loads(config)
+    now = datetime.utcnow()
 
     # Build export
     export = {
         "metadata": {
             "tool_version": settings.app_version,
-            "exported_at": datetime.utcnow().isoformat() + "Z",
+            "exported_at": now.isoformat() + "Z",
         },
         "chain": {
             "id": job["chain_id"],
@@ -527,14 +521,14 @@ async def export_json(job_id: str) -> Response:
             "completed_at": job.get("completed_at"),
             "duration_seconds": job.get("duration_seconds"),
             "status": job["status"],
-            "config": config,
+            "config": job["config"],
         },
         "providers": [
             {
                 "id": p["id"],
                 "name": p["name"],
                 "region": p.get("region"),
-                "url_hash": hashlib.sha256(p["url"].encode()).hexdigest()[:16],
+                "url_hash": p["url_hash"],
             }
             for p in providers
         ],
@@ -543,13 +537,10 @@ async def export_json(job_id: str) -> Response:
         "results": results,
     }
 
-    # Generate filename
-    chain_name = job["chain_name"].lower().replace(" ", "_")
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H%M%S")
-    filename = f"benchmark_{chain_name}_{job['chain_id']}_{timestamp}.json"
+    filename = _export_filename(job, now, "json")
 
-    return Response(
-        content=json.dumps(export, indent=2, default=str),
+    return StreamingResponse(
+        _iter_json(export),
         media_type="application/json",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -561,7 +552,7 @@ async def export_csv(job_id: str) -> Response:
     db = await get_db()
     job = await db.get_job(job_id)
     if job is None:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        return _not_found(f"Job {job_id} not found")
 
     providers = await db.get_job_providers(job_id)
     results = await benchmark_service.get_job_results(job_id)
@@ -569,38 +560,44 @@ async def export_csv(job_id: str) -> Response:
     # Create provider ID to name map
     provider_names = {p["id"]: p["name"] for p in providers}
 
-    # Build CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
+    async def row_generator():
+        # Stream rows through a small reusable buffer
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
 
-    # Write header
-    writer.writerow([
-        "Provider", "Test", "Category", "Label",
-        "Cold (ms)", "Warm (ms)", "Cache Speedup",
-        "Success Rate", "Count"
-    ])
+        def flush() -> str:
+            chunk = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            return chunk
 
-    # Write aggregated results
-    for agg in results.get("aggregated", []):
+        # Write header
         writer.writerow([
-            provider_names.get(agg["provider_id"], agg["provider_id"]),
-            agg["test_name"],
-            agg["category"],
-            agg["label"],
-            f"{agg['cold_ms']:.1f}" if agg.get("cold_ms") else "",
-            f"{agg['warm_ms']:.1f}" if agg.get("warm_ms") else "",
-            f"{agg['cache_speedup']:.2f}" if agg.get("cache_speedup") else "",
-            f"{agg['success_rate']:.1%}" if agg.get("success_rate") is not None else "",
-            agg.get("count", ""),
+            "Provider", "Test", "Category", "Label",
+            "Cold (ms)", "Warm (ms)", "Cache Speedup",
+            "Success Rate", "Count"
         ])
-
-    # Generate filename
-    chain_name = job["chain_name"].lower().replace(" ", "_")
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d_%H%M%S")
-    filename = f"benchmark_{chain_name}_{job['chain_id']}_{timestamp}.csv"
-
-    return Response(
-        content=output.getvalue(),
+        yield flush()
+
+        # Write aggregated results
+        for agg in results.get("aggregated", []):
+            writer.writerow([
+                provider_names.get(agg["provider_id"], agg["provider_id"]),
+                agg["test_name"],
+                agg["category"],
+                agg["label"],
+                f"{agg['cold_ms']:.1f}" if agg.get("cold_ms") else "",
+                f"{agg['warm_ms']:.1f}" if agg.get("warm_ms") else "",
+                f"{agg['cache_speedup']:.2f}" if agg.get("cache_speedup") else "",
+                f"{agg['success_rate']:.1%}" if agg.get("success_rate") is not None else "",
+                agg.get("count", ""),
+            ])
+            yield flush()
+
+    filename = _export_filename(job, datetime.utcnow(), "csv")
+
+    return StreamingResponse(
+        row_generator(),
         media_type="text/csv",
         headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
@@ -618,9 +615,11 @@ async def import_results(file: UploadFile = File(...)) -> dict[str, Any]:
 
     try:
         content = await file.read()
-        data = json.loads(content.decode("utf-8"))
-    except json.JSONDecodeError as e:
+        data = await json_loads_async(content)
+    except JSONDecodeError as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON: {e}")
+    # Release the raw upload before the (potentially large) DB import
+    del content
 
     # Validate required fields
     required = ["chain", "job", "providers", "results"]
@@ -628,8 +627,6 @@ async def import_results(file: UploadFile = File(...)) -> dict[str, Any]:
     if missing:
         raise HTTPException(status_code=400, detail=f"Missing required fields: {missing}")
 
-    db = await get_db()
-
     # Extract data
     chain = data["chain"]
     job_data = data["job"]
@@ -637,97 +634,98 @@ async def import_results(file: UploadFile = File(...)) -> dict[str, Any]:
     results = data["results"]
     test_params = data.get("test_params")
     tests_executed = data.get("tests_executed", [])
+    sequential = results.get("sequential", [])
+
+    # Reject unsupported enum values before anything is written, so a bad file
+    # never leaves a half-imported job behind
+    invalid = _invalid_import_values(sequential)
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Unsupported values in results: {invalid}")
+
+    db = await get_db()
 
     # Generate new job ID for imported data (with 'imp-' prefix)
     import uuid
     job_id = f"imp-{str(uuid.uuid4())[:6]}"
 
+    # Provider ids are global primary keys, so give each imported provider a
+    # fresh one and remap the results to it (re-importing an export must not
+    # collide with the job it came from)
+    imported_providers = [
+        # Generate fake URLs since we only have hashes
+        {**p, "id": str(uuid.uuid4())[:8], "url": f"imported://{p.get('url_hash', 'unknown')}"}
+        for p in providers
+    ]
+    provider_ids = {old.get("id"): new["id"] for old, new in zip(providers, imported_providers)}
+
     # Get config from job data
     config = job_data.get("config", {})
 
-    # Create job record
-    await db.create_job(
-        job_id=job_id,
-        chain_id=chain["id"],
-        chain_name=chain["name"],
-        status="imported",
-        config=config,
-    )
-
-    # Update job with completion info
-    await db.update_job_status(
-        job_id=job_id,
-        status="imported",
-        completed_at=datetime.fromisoformat(job_data["completed_at"].replace("Z", "")) if job_data.get("completed_at") else None,
-        duration_seconds=job_data.get("duration_seconds"),
-    )
-
-    # Add providers (generate fake URLs since we only have hashes)
-    for p in providers:
-        await db.add_job_provider(
-            job_id=job_id,
-            provider_id=p["id"],
-            name=p["name"],
-            url=f"imported://{p.get('url_hash', 'unknown')}",
-            region=p.get("region"),
-        )
+    # Fallback timestamp for rows exported without one
+    imported_at = datetime.utcnow().isoformat()
 
-    # Save test params if present
-    if test_params:
-        await db.save_job_test_params(job_id, test_params)
-
-    # Save tests executed
-    for test in tests_executed:
-        await db.save_job_test_executed(job_id, test.get("id", 0), test)
-
-    # Import sequential test results
-    sequential = results.get("sequential", [])
-    for r in sequential:
-        test_result = {
-            "job_id": job_id,
-            "provider_id": r.get("provider_id"),
-            "test_id": r.get("test_id"),
-            "test_name": r.get("test_name"),
-            "category": r.get("category"),
-            "label": r.get("label"),
-            "iteration": r.get("iteration", 1),
-            "iteration_type": r.get("iteration_type", "warm"),
-            "response_time_ms": r.get("response_time_ms"),
-            "success": r.get("success", False),
-            "error_type": r.get("error_type"),
-            "error_message": r.get("error_message"),
-            "http_status": r.get("http_status"),
-            "response_size_bytes": r.get("response_size_bytes"),
-            "log_count": r.get("log_count"),  # For getLogs tests
-            "timestamp": r.get("timestamp", datetime.utcnow().isoformat()),
-        }
-        await db.save_test_result(test_result)
-
-    # Import load test results
     load_tests = results.get("load_tests", [])
-    for lt in load_tests:
-        load_result = {
+
+    # Write the job, its providers and every result in one transaction
+    await db.import_job(
+        job={
             "job_id": job_id,
-            "provider_id": lt.get("provider_id"),
-            "test_id": lt.get("test_id"),
-            "test_name": lt.get("test_name"),
-            "method": lt.get("method", "unknown"),
-            "concurrency": lt.get("concurrency", 0),
-            "total_time_ms": lt.get("total_time_ms", 0),
-            "min_ms": lt.get("min_ms", 0),
-            "max_ms": lt.get("max_ms", 0),
-            "avg_ms": lt.get("avg_ms", 0),
-            "p50_ms": lt.get("p50_ms", 0),
-            "p95_ms": lt.get("p95_ms", 0),
-            "p99_ms": lt.get("p99_ms", 0),
-            "success_count": lt.get("success_count", 0),
-            "error_count": lt.get("error_count", 0),
-            "success_rate": lt.get("success_rate", 0),
-            "throughput_rps": lt.get("throughput_rps", 0),
-            "errors": lt.get("errors", []),
-            "timestamp": lt.get("timestamp", datetime.utcnow().isoformat()),
-        }
-        await db.save_load_test_result(load_result)
+            "chain_id": chain["id"],
+            "chain_name": chain["name"],
+            "status": "imported",
+            "config": config,
+            "completed_at": _parse_utc(job_data["completed_at"]) if job_data.get("completed_at") else None,
+            "duration_seconds": job_data.get("duration_seconds"),
+        },
+        providers=imported_providers,
+        test_params=test_params,
+        tests_executed=((test.get("id", 0), test) for test in tests_executed),
+        results=(
+            {
+                "job_id": job_id,
+                "provider_id": provider_ids.get(r.get("provider_id"), r.get("provider_id")),
+                "test_id": r.get("test_id"),
+                "test_name": r.get("test_name"),
+                "category": r.get("category"),
+                "label": r.get("label"),
+                "iteration": r.get("iteration", 1),
+                "iteration_type": r.get("iteration_type", "warm"),
+                "response_time_ms": r.get("response_time_ms"),
+                "success": r.get("success", False),
+                "error_type": r.get("error_type"),
+                "error_message": r.get("error_message"),
+                "http_status": r.get("http_status"),
+                "response_size_bytes": r.get("response_size_bytes"),
+                "log_count": r.get("log_count"),  # For getLogs tests
+                "timestamp": r.get("timestamp", imported_at),
+            }
+            for r in sequential
+        ),
+        load_results=(
+            {
+                "job_id": job_id,
+                "provider_id": provider_ids.get(lt.get("provider_id"), lt.get("provider_id")),
+                "test_id": lt.get("test_id"),
+                "test_name": lt.get("test_name"),
+                "method": lt.get("method", "unknown"),
+                "concurrency": lt.get("concurrency", 0),
+                "total_time_ms": lt.get("total_time_ms", 0),
+                "min_ms": lt.get("min_ms", 0),
+                "max_ms": lt.get("max_ms", 0),
+                "avg_ms": lt.get("avg_ms", 0),
+                "p50_ms": lt.get("p50_ms", 0),
+                "p95_ms": lt.get("p95_ms", 0),
+                "p99_ms": lt.get("p99_ms", 0),
+                "success_count": lt.get("success_count", 0),
+                "error_count": lt.get("error_count", 0),
+                "success_rate": lt.get("success_rate", 0),
+                "throughput_rps": lt.get("throughput_rps", 0),
+                "errors": lt.get("errors", []),
+                "timestamp": lt.get("timestamp", imported_at),
+            }
+            for lt in load_tests
+        ),
+    )
 
     return {
         "success": True,
@@ -742,6 +740,284 @@ async def import_results(file: UploadFile = File(...)) -> dict[str, Any]:
 # Helpers
 # ============================================================================
 
+# Enum-valued result fields (with their import defaults) and the values they accept
+IMPORT_ENUM_FIELDS: dict[str, tuple[str | None, frozenset[str]]] = {
+    "category": (None, frozenset(c.value for c in TestCategory)),
+    "label": (None, frozenset(label.value for label in TestLabel)),
+    "iteration_type": ("warm", frozenset(t.value for t in IterationType)),
+}
+
+
+def _invalid_import_values(rows: list[dict[str, Any]]) -> dict[str, list[str]]:
+    """Collect enum fields whose imported values the results tables cannot store."""
+    invalid: dict[str, set[str]] = {}
+    for r in rows:
+        for field, (default, allowed) in IMPORT_ENUM_FIELDS.items():
+            value = r.get(field, default)
+            if not isinstance(value, str) or value not in allowed:
+                invalid.setdefault(field, set()).add(str(value))
+    return {field: sorted(values) for field, values in invalid.items()}
+
+
+def _json_response(data: Any, status_code: int = 200) -> Response:
+    """Encode a JSON response directly, bypassing response_model validation and jsonable_encoder."""
+    return Response(content=json_dumps_bytes(data), status_code=status_code, media_type="application/json")
+
+
+def _not_found(detail: str) -> Response:
+    """Build a 404 response directly instead of raising HTTPException."""
+    return _json_response({"detail": detail}, status_code=404)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Response size caps for validation requests (getLogs responses can be large)
+MAX_RESPONSE_BYTES = 64 * 1024
+MAX_LOGS_RESPONSE_BYTES = 32 * 1024 * 1024
+
+
+async def _rpc(
+    client: httpx.AsyncClient,
+    url: str,
+    method: str,
+    params: list[Any],
+    timeout: float = 10,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+) -> dict[str, Any]:
+    """Send a single JSON-RPC request and return the decoded response."""
+    return await _post_rpc(client, url, encode_rpc_request(method, params), timeout, max_bytes)
+
+
+async def _post_rpc(
+    client: httpx.AsyncClient,
+    url: str,
+    body: bytes,
+    timeout: float,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+    check_status: bool = False,
+) -> Any:
+    """POST a JSON-RPC body and decode the response, aborting oversized bodies.
+
+    With ``check_status``, non-2xx responses raise ``httpx.HTTPStatusError``
+    instead of being decoded.
+    """
+    async with client.stream(
+        "POST", url, content=body, headers=JSON_HEADERS, timeout=timeout
+    ) as response:
+        if check_status:
+            response.raise_for_status()
+        chunks = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValueError(f"Response too large (over {max_bytes} bytes)")
+            chunks.append(chunk)
+    return json_loads(b"".join(chunks))
+
+
+async def _rpc_batch(
+    client: httpx.AsyncClient,
+    url: str,
+    calls: dict[str, tuple[str, list[Any]]],
+    timeout: float = 10,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+) -> dict[str, dict[str, Any] | Exception]:
+    """Send several JSON-RPC requests as one batch, keyed like ``calls``.
+
+    Each value is either the decoded response for that call or the exception
+    raised while fetching it. Providers that reject batch requests (a non-list
+    reply, a non-2xx status or a body that is not JSON) are retried with
+    individual concurrent requests.
+    """
+    keys = list(calls)
+    batch = [
+        {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+        for i, (method, params) in enumerate(calls.values(), start=1)
+    ]
+    try:
+        data = await _post_rpc(client, url, json_dumps_bytes(batch), timeout, max_bytes, check_status=True)
+    except (httpx.HTTPStatusError, JSONDecodeError):
+        data = None  # Batch rejected with an error page
+    except Exception as e:
+        return {key: e for key in keys}
+
+    if not isinstance(data, list):
+        # Batch not supported - fall back to individual requests
+        results = await asyncio.gather(
+            *[
+                _rpc(client, url, method, params, timeout, max_bytes)
+                for method, params in calls.values()
+            ],
+            return_exceptions=True,
+        )
+        return dict(zip(keys, results))
+
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    return {
+        key: by_id.get(i, Exception("No response for batched request"))
+        for i, key in enumerate(keys, start=1)
+    }
+
+
+@lru_cache(maxsize=32)
+def _sse_prefix(event: str) -> bytes:
+    """Pre-encoded SSE frame header for an event name."""
+    return b"event: " + event.encode() + b"\r\ndata: "
+
+
+def _encode_sse(event: str, data: dict[str, Any]) -> bytes:
+    """Encode an event as a complete SSE frame (passed through as-is by EventSourceResponse)."""
+    return _sse_prefix(event) + json_dumps_bytes(data) + b"\r\n\r\n"
+
+
+# SSE events that only report incremental progress and may be coalesced
+PROGRESS_EVENTS = {"iteration_complete"}
+
+# Per-result fields of a progress event, kept for every event folded into a coalesced frame
+PROGRESS_RESULT_FIELDS = ("provider_name", "test_name", "response_time_ms", "success")
+
+# Backlog of undelivered events beyond which new progress events are dropped
+SSE_QUEUE_MAX_EVENTS = 1024
+
+_STREAM_DONE = object()
+
+
+def _merge_progress(pending: list[SSEEvent]) -> SSEEvent:
+    """Fold buffered progress events into the latest one, carrying each event's result."""
+    latest = pending[-1]
+    if len(pending) == 1:
+        return latest
+    results = [{field: e.data.get(field) for field in PROGRESS_RESULT_FIELDS} for e in pending]
+    return SSEEvent(event=latest.event, data={**latest.data, "results": results})
+
+
+async def _coalesce_progress(
+    events: AsyncGenerator[SSEEvent, None], interval_ms: int
+) -> AsyncGenerator[SSEEvent, None]:
+    """Forward events, sending at most one progress event per interval.
+
+    The source is drained by its own task, so a slow client never holds up
+    the benchmark; if the backlog grows too large, progress events are
+    dropped and an "events_dropped" event with their count is sent in
+    their place. Progress events arriving within an interval are merged into
+    one frame carrying the latest progress plus a "results" list with every
+    merged event's result. All other events are forwarded in order,
+    preceded by any pending progress.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        dropped = 0
+        try:
+            async for event in events:
+                if event.event in PROGRESS_EVENTS and queue.qsize() >= SSE_QUEUE_MAX_EVENTS:
+                    dropped += 1
+                    continue
+                if dropped:
+                    queue.put_nowait(SSEEvent(event="events_dropped", data={"count": dropped}))
+                    dropped = 0
+                queue.put_nowait(event)
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            if dropped:
+                queue.put_nowait(SSEEvent(event="events_dropped", data={"count": dropped}))
+            queue.put_nowait(_STREAM_DONE)
+
+    loop = asyncio.get_running_loop()
+    interval = interval_ms / 1000
+    task = asyncio.create_task(pump())
+    pending: list[SSEEvent] = []
+    last_sent = 0.0
+
+    try:
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, last_sent + interval - loop.time())
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield _merge_progress(pending)
+                pending = []
+                last_sent = loop.time()
+                continue
+
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            if item.event in PROGRESS_EVENTS:
+                pending.append(item)
+                if loop.time() - last_sent >= interval:
+                    yield _merge_progress(pending)
+                    pending = []
+                    last_sent = loop.time()
+                continue
+
+            if pending:
+                yield _merge_progress(pending)
+                pending = []
+            yield item
+            last_sent = loop.time()
+
+        if pending:
+            yield _merge_progress(pending)
+    finally:
+        task.cancel()
+
+
+# Size of each chunk written when streaming JSON exports
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+_export_encoder = json.JSONEncoder(indent=2, default=str)
+
+
+async def _iter_json(obj: Any) -> AsyncGenerator[str, None]:
+    """Incrementally encode an object as indented JSON, yielding sized chunks.
+
+    Encoding runs in a worker thread so large exports don't block the event loop.
+    """
+    parts_iter = _export_encoder.iterencode(obj)
+
+    def next_chunk() -> str:
+        parts: list[str] = []
+        size = 0
+        for part in parts_iter:
+            parts.append(part)
+            size += len(part)
+            if size >= JSON_STREAM_CHUNK_SIZE:
+                break
+        return "".join(parts)
+
+    while chunk := await asyncio.to_thread(next_chunk):
+        yield chunk
+
+
+def _export_filename(job: dict[str, Any], now: datetime, extension: str) -> str:
+    """Build the download filename for an exported job."""
+    chain_name = job["chain_name"].lower().replace(" ", "_")
+    timestamp = (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}_"
+        f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+    )
+    return f"benchmark_{chain_name}_{job['chain_id']}_{timestamp}.{extension}"
+
+
+def _parse_utc(value: str) -> datetime:
+    """Parse an ISO timestamp, accepting a trailing 'Z'."""
+    return datetime.fromisoformat(value[:-1] if value.endswith("Z") else value)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_int(value: str) -> int:
+    """Parse a hex quantity from an RPC response."""
+    return int(value, 16) if value else 0
+
+
+@lru_cache(maxsize=256)
 def _mask_url(url: str) -> str:
     """Mask API keys in URL for display."""
     # Simple masking - hide query params that might contain keys
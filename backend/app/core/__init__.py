@@ -1,4 +1,13 @@
 from .config import settings
 from .database import Database, get_db, init_db
+from .http import get_rpc_client, close_rpc_client, create_benchmark_client
 
-__all__ = ["settings", "Database", "get_db", "init_db"]
+__all__ = [
+    "settings",
+    "Database",
+    "get_db",
+    "init_db",
+    "get_rpc_client",
+    "close_rpc_client",
+    "create_benchmark_client",
+]
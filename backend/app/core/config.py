@@ -5,12 +5,31 @@ import os
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+
+# Environment variables named RPC_BENCHMARKER_<FIELD> override these settings
+ENV_PREFIX = "RPC_BENCHMARKER_"
+ENV_FIELDS = (
+    "debug",
+    "host",
+    "port",
+    "data_dir",
+    "db_journal_mode",
+    "db_synchronous",
+    "db_cache_size_kib",
+    "db_mmap_size_bytes",
+    "db_busy_timeout_ms",
+    "db_reader_connections",
+    "sse_ping_seconds",
+    "sse_coalesce_ms",
+)
 
 
 class Settings(BaseModel):
     """Application settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     # Application
     app_name: str = "RPC Benchmarker"
     app_version: str = "1.0.0"
@@ -28,6 +47,31 @@ class Settings(BaseModel):
     default_delay_ms: int = 100
     default_iteration_mode: str = "standard"
 
+    # SQLite tuning (WAL requires the database to live on a local filesystem)
+    db_journal_mode: str = "WAL"
+    db_synchronous: str = "NORMAL"
+    db_cache_size_kib: int = 64000
+    db_mmap_size_bytes: int = 256 * 1024 * 1024
+    db_busy_timeout_ms: int = 5000
+    db_reader_connections: int = 4  # Read-only connections alongside the single writer
+
+    # Server-Sent Events
+    sse_ping_seconds: int = 15
+    sse_coalesce_ms: int = 100  # Minimum interval between progress events (0 = send all)
+
+    # Data directory already created by ensure_data_dir()
+    _prepared_data_dir: Path | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings, applying RPC_BENCHMARKER_* overrides for ENV_FIELDS."""
+        overrides = {}
+        for name in ENV_FIELDS:
+            value = os.getenv(f"{ENV_PREFIX}{name.upper()}")
+            if value:
+                overrides[name] = value
+        return cls(**overrides)
+
     @property
     def db_path(self) -> Path:
         return self.data_dir / "benchmarks.db"
@@ -42,8 +86,11 @@ class Settings(BaseModel):
 
     def ensure_data_dir(self) -> None:
         """Ensure data directory and subdirectories exist."""
+        if self._prepared_data_dir == self.data_dir:
+            return
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.chains_dir.mkdir(parents=True, exist_ok=True)
+        self._prepared_data_dir = self.data_dir
 
     def load_app_config(self) -> dict[str, Any]:
         """Load application config from file."""
@@ -59,15 +106,5 @@ class Settings(BaseModel):
             json.dump(config, f, indent=2)
 
 
-# Global settings instance
-settings = Settings()
-
-# Override from environment
-if os.getenv("RPC_BENCHMARKER_DEBUG"):
-    settings.debug = True
-if os.getenv("RPC_BENCHMARKER_HOST"):
-    settings.host = os.getenv("RPC_BENCHMARKER_HOST")
-if os.getenv("RPC_BENCHMARKER_PORT"):
-    settings.port = int(os.getenv("RPC_BENCHMARKER_PORT"))
-if os.getenv("RPC_BENCHMARKER_DATA_DIR"):
-    settings.data_dir = Path(os.getenv("RPC_BENCHMARKER_DATA_DIR"))
+# Global settings instance (validated once, read-only afterwards)
+settings = Settings.from_env()
@@ -1,13 +1,25 @@
 """SQLite database layer using aiosqlite."""
 
-import json
+import asyncio
+import hashlib
+import logging
+import zlib
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator
+from itertools import islice
+from operator import itemgetter
+from typing import Any, AsyncGenerator, Iterable, Iterator
 
 import aiosqlite
 
+from ..models.schemas import ErrorCategory, IterationType, TestCategory, TestLabel
 from .config import settings
+from .serialization import json_dumps, json_loads, map_offloaded
+
+logger = logging.getLogger(__name__)
+
+# Stored in PRAGMA user_version; bump whenever SCHEMA or the migrations change
+SCHEMA_VERSION = 2
 
 # SQL Schema
 SCHEMA = """
@@ -30,6 +42,7 @@ CREATE TABLE IF NOT EXISTS job_providers (
     job_id TEXT NOT NULL REFERENCES jobs(id) ON DELETE CASCADE,
     name TEXT NOT NULL,
     url TEXT NOT NULL,
+    url_hash TEXT,
     region TEXT
 );
 
@@ -54,13 +67,13 @@ CREATE TABLE IF NOT EXISTS test_results (
     provider_id TEXT NOT NULL,
     test_id INTEGER NOT NULL,
     test_name TEXT NOT NULL,
-    category TEXT NOT NULL,
-    label TEXT NOT NULL,
+    category INTEGER NOT NULL,
+    label INTEGER NOT NULL,
     iteration INTEGER NOT NULL,
-    iteration_type TEXT NOT NULL,
+    iteration_type INTEGER NOT NULL,
     response_time_ms REAL,
     success INTEGER NOT NULL,
-    error_type TEXT,
+    error_type INTEGER,
     error_message TEXT,
     http_status INTEGER,
     response_size_bytes INTEGER,
@@ -95,11 +108,170 @@ CREATE TABLE IF NOT EXISTS load_test_results (
 -- Indexes
 CREATE INDEX IF NOT EXISTS idx_jobs_chain ON jobs(chain_id);
 CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
-CREATE INDEX IF NOT EXISTS idx_test_results_job ON test_results(job_id);
 CREATE INDEX IF NOT EXISTS idx_test_results_provider ON test_results(provider_id);
-CREATE INDEX IF NOT EXISTS idx_load_results_job ON load_test_results(job_id);
+CREATE INDEX IF NOT EXISTS idx_job_providers_job ON job_providers(job_id);
+CREATE INDEX IF NOT EXISTS idx_tests_executed_job ON job_tests_executed(job_id, test_id);
+-- Composite indexes matching the result read queries (filter + ORDER BY)
+CREATE INDEX IF NOT EXISTS idx_test_results_job_order
+    ON test_results(job_id, provider_id, test_id, iteration);
+CREATE INDEX IF NOT EXISTS idx_load_results_job_order
+    ON load_test_results(job_id, provider_id, test_id);
+-- Superseded by the composite indexes above
+DROP INDEX IF EXISTS idx_test_results_job;
+DROP INDEX IF EXISTS idx_load_results_job;
+"""
+
+INSERT_TEST_RESULT_SQL = """
+INSERT INTO test_results (
+    job_id, provider_id, test_id, test_name, category, label,
+    iteration, iteration_type, response_time_ms, success,
+    error_type, error_message, http_status, response_size_bytes,
+    log_count, timestamp
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+UPDATE_JOB_STATUS_SQL = """
+UPDATE jobs
+SET status = ?, completed_at = ?, duration_seconds = ?, error_message = ?
+WHERE id = ?
+"""
+
+INSERT_LOAD_TEST_RESULT_SQL = """
+INSERT INTO load_test_results (
+    job_id, provider_id, test_id, test_name, method, concurrency,
+    total_time_ms, min_ms, max_ms, avg_ms, p50_ms, p95_ms, p99_ms,
+    success_count, error_count, success_rate, throughput_rps, errors_json, timestamp
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
+UPSERT_JOB_SQL = """
+INSERT INTO jobs (
+    id, chain_id, chain_name, status, config_json, created_at,
+    completed_at, duration_seconds, error_message
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    status = excluded.status,
+    completed_at = excluded.completed_at,
+    duration_seconds = excluded.duration_seconds,
+    error_message = excluded.error_message
+"""
+
+INSERT_JOB_PROVIDER_SQL = """
+INSERT INTO job_providers (id, job_id, name, url, url_hash, region)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+UPSERT_TEST_PARAMS_SQL = """
+INSERT OR REPLACE INTO job_test_params (job_id, params_json)
+VALUES (?, ?)
+"""
+
+INSERT_TEST_EXECUTED_SQL = """
+INSERT INTO job_tests_executed (job_id, test_id, test_json)
+VALUES (?, ?, ?)
+"""
+
+# Tables holding per-job rows, all indexed on job_id
+JOB_CHILD_TABLES = (
+    "test_results",
+    "load_test_results",
+    "job_tests_executed",
+    "job_test_params",
+    "job_providers",
+)
+
+# Required result fields, in INSERT column order
+_test_result_fields = itemgetter("job_id", "provider_id", "test_id", "test_name")
+_load_test_result_fields = itemgetter(
+    "job_id", "provider_id", "test_id", "test_name", "method", "concurrency",
+    "total_time_ms", "min_ms", "max_ms", "avg_ms", "p50_ms", "p95_ms", "p99_ms",
+    "success_count", "error_count", "success_rate", "throughput_rps",
+)
+
+# Integer codes for the enum columns of test_results (append only, never renumber)
+CATEGORY_CODES = {
+    TestCategory.SIMPLE.value: 0,
+    TestCategory.MEDIUM.value: 1,
+    TestCategory.COMPLEX.value: 2,
+    TestCategory.LOAD.value: 3,
+}
+LABEL_CODES = {
+    TestLabel.LATEST.value: 0,
+    TestLabel.ARCHIVAL.value: 1,
+}
+ITERATION_TYPE_CODES = {
+    IterationType.COLD.value: 0,
+    IterationType.WARM.value: 1,
+    IterationType.SUSTAINED.value: 2,
+}
+ERROR_TYPE_CODES = {
+    ErrorCategory.TIMEOUT.value: 0,
+    ErrorCategory.RATE_LIMIT.value: 1,
+    ErrorCategory.CONNECTION.value: 2,
+    ErrorCategory.UNSUPPORTED.value: 3,
+    ErrorCategory.INVALID_PARAMS.value: 4,
+    ErrorCategory.EXECUTION_REVERTED.value: 5,
+    ErrorCategory.BLOCK_RANGE_LIMIT.value: 6,
+    ErrorCategory.RPC_ERROR.value: 7,
+    ErrorCategory.UNKNOWN.value: 8,
+}
+_category_names = {code: name for name, code in CATEGORY_CODES.items()}
+_label_names = {code: name for name, code in LABEL_CODES.items()}
+_iteration_type_names = {code: name for name, code in ITERATION_TYPE_CODES.items()}
+_error_type_names = {code: name for name, code in ERROR_TYPE_CODES.items()}
+
+# Stored JSON documents at least this long are zlib-compressed into a BLOB
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 3
+
+# Rows per executemany call for bulk inserts
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Rows fetched per round trip when streaming results
+FETCH_CHUNK_SIZE = 1000
+
+# Write-behind batching: commit after this many queued writes or this long
+WRITE_BATCH_MAX_ROWS = 1000
+WRITE_BATCH_INTERVAL_SECONDS = 0.05
+# Queued writes allowed before producers wait for the writer (backpressure)
+WRITE_QUEUE_MAX_ITEMS = 4 * WRITE_BATCH_MAX_ROWS
+
+# A queued write-behind statement: (job_id, sql, params)
+QueuedWrite = tuple[str, str, tuple]
+
+
+def hash_url(url: str) -> str:
+    """Short, non-reversible identifier for a provider URL."""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
+def _pack_json(obj: Any) -> str | bytes:
+    """Serialize a stored document, compressing large ones."""
+    text = json_dumps(obj)
+    if len(text) < COMPRESS_MIN_BYTES:
+        return text
+    return zlib.compress(text.encode(), COMPRESS_LEVEL)
+
+
+def _unpack_json(value: str | bytes) -> Any:
+    """Parse a document written by _pack_json; TEXT values are uncompressed."""
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    return json_loads(value)
+
+
+def _encode_error_type(error_type: str | None) -> int | None:
+    """Integer code for an error type; unrecognised types are stored as unknown."""
+    if error_type is None:
+        return None
+    return ERROR_TYPE_CODES.get(error_type, ERROR_TYPE_CODES[ErrorCategory.UNKNOWN.value])
+
+
+def _case_sql(column: str, codes: dict[str, int], default: int) -> str:
+    """SQL expression mapping a TEXT enum column to its integer code."""
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"CASE {column} {whens} ELSE {default} END"
+
 
 class Database:
     """Async SQLite database wrapper."""
@@ -107,17 +279,62 @@ class Database:
     def __init__(self, db_path: str | None = None):
         self.db_path = db_path or str(settings.db_path)
         self._connection: aiosqlite.Connection | None = None
+        self._readers: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._reader_connections: list[aiosqlite.Connection] = []
+        self._write_lock = asyncio.Lock()
+        self._write_queue: asyncio.Queue[QueuedWrite | asyncio.Future] = asyncio.Queue(
+            maxsize=WRITE_QUEUE_MAX_ITEMS
+        )
+        self._pending_writes = 0
+        self._write_errors: dict[str, Exception] = {}  # First failed write per job since its last flush()
+        self._writer_task: asyncio.Task | None = None
 
     async def connect(self) -> None:
         """Connect to the database and initialize schema."""
         settings.ensure_data_dir()
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
-        await self._connection.executescript(SCHEMA)
-        await self._connection.commit()
+        await self._apply_pragmas()
+
+        # Create the schema and run migrations only when the file is behind
+        rows = await self.conn.execute_fetchall("PRAGMA user_version")
+        if rows[0][0] < SCHEMA_VERSION:
+            await self.conn.executescript(SCHEMA)
+            await self.conn.commit()
+
+            # Run migrations for existing databases
+            await self._run_migrations()
+            await self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            await self.conn.commit()
+
+        # Gather planner statistics once so the composite indexes are used
+        async with self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ) as cursor:
+            has_stats = await cursor.fetchone() is not None
+        await self.conn.execute("PRAGMA optimize" if has_stats else "ANALYZE")
+        await self.conn.commit()
 
-        # Run migrations for existing databases
-        await self._run_migrations()
+        # Readers see committed data under WAL without blocking the writer
+        for _ in range(max(1, settings.db_reader_connections)):
+            reader = await aiosqlite.connect(self.db_path)
+            reader.row_factory = aiosqlite.Row
+            await self._apply_pragmas(reader)
+            await reader.execute("PRAGMA query_only=ON")
+            self._reader_connections.append(reader)
+            self._readers.put_nowait(reader)
+
+        self._writer_task = asyncio.create_task(self._writer_loop())
+
+    async def _apply_pragmas(self, conn: aiosqlite.Connection | None = None) -> None:
+        """Tune SQLite for a write-heavy workload."""
+        conn = conn or self.conn
+        await conn.execute(f"PRAGMA journal_mode={settings.db_journal_mode}")
+        await conn.execute(f"PRAGMA synchronous={settings.db_synchronous}")
+        await conn.execute("PRAGMA temp_store=MEMORY")
+        await conn.execute(f"PRAGMA cache_size=-{settings.db_cache_size_kib}")
+        await conn.execute(f"PRAGMA mmap_size={settings.db_mmap_size_bytes}")
+        await conn.execute(f"PRAGMA busy_timeout={settings.db_busy_timeout_ms}")
 
     async def _run_migrations(self) -> None:
         """Run database migrations for schema updates."""
@@ -129,19 +346,203 @@ class Database:
             await self.conn.execute("ALTER TABLE test_results ADD COLUMN log_count INTEGER")
             await self.conn.commit()
 
+        # Migration: Add url_hash column to job_providers and backfill it
+        try:
+            await self.conn.execute("SELECT url_hash FROM job_providers LIMIT 1")
+        except Exception:
+            await self.conn.execute("ALTER TABLE job_providers ADD COLUMN url_hash TEXT")
+            async with self.conn.execute("SELECT id, url FROM job_providers") as cursor:
+                rows = await cursor.fetchall()
+            await self.conn.executemany(
+                "UPDATE job_providers SET url_hash = ? WHERE id = ?",
+                [(hash_url(row["url"]), row["id"]) for row in rows],
+            )
+            await self.conn.commit()
+
+        # Migration: Store test_results enum columns as integer codes
+        async with self.conn.execute(
+            "SELECT type FROM pragma_table_info('test_results') WHERE name = 'category'"
+        ) as cursor:
+            row = await cursor.fetchone()
+        if row and row["type"].upper() == "TEXT":
+            unknown = ERROR_TYPE_CODES[ErrorCategory.UNKNOWN.value]
+            columns = (
+                "id, job_id, provider_id, test_id, test_name, category, label, iteration, "
+                "iteration_type, response_time_ms, success, error_type, error_message, "
+                "http_status, response_size_bytes, log_count, timestamp"
+            )
+            await self.conn.executescript(f"""
+                BEGIN;
+                ALTER TABLE test_results RENAME TO test_results_text;
+                DROP INDEX IF EXISTS idx_test_results_provider;
+                DROP INDEX IF EXISTS idx_test_results_job_order;
+                {SCHEMA}
+                INSERT INTO test_results ({columns})
+                SELECT
+                    id, job_id, provider_id, test_id, test_name,
+                    {_case_sql("category", CATEGORY_CODES, 0)},
+                    {_case_sql("label", LABEL_CODES, 0)},
+                    iteration,
+                    {_case_sql("iteration_type", ITERATION_TYPE_CODES, 0)},
+                    response_time_ms, success,
+                    CASE WHEN error_type IS NULL THEN NULL
+                         ELSE {_case_sql("error_type", ERROR_TYPE_CODES, unknown)} END,
+                    error_message, http_status, response_size_bytes, log_count, timestamp
+                FROM test_results_text;
+                DROP TABLE test_results_text;
+                COMMIT;
+            """)
+
     async def disconnect(self) -> None:
         """Disconnect from the database."""
+        if self._writer_task:
+            await self._wait_for_writes()
+            self._writer_task.cancel()
+            # Let the writer unwind before its connection is closed underneath it
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+        for reader in self._reader_connections:
+            await reader.close()
+        self._reader_connections.clear()
+        self._readers = asyncio.Queue()
         if self._connection:
             await self._connection.close()
             self._connection = None
 
+    # ========================================================================
+    # Write-behind queue
+    # ========================================================================
+
+    async def _enqueue_write(self, job_id: str, sql: str, params: tuple) -> None:
+        """Queue a write for a job to be committed by the background writer."""
+        self._pending_writes += 1
+        await self._write_queue.put((job_id, sql, params))
+
+    async def flush(self, job_id: str) -> None:
+        """Wait until all queued writes are committed.
+
+        Raises the first write failure for ``job_id`` since its previous flush,
+        so that job's rolled back writes are never silently dropped.
+        """
+        await self._wait_for_writes()
+        error = self._write_errors.pop(job_id, None)
+        if error is not None:
+            raise error
+
+    async def _wait_for_writes(self) -> None:
+        """Wait until everything queued so far has been written (committed or rolled back)."""
+        if self._pending_writes == 0 or self._writer_task is None:
+            return
+        marker = asyncio.get_running_loop().create_future()
+        await self._write_queue.put(marker)
+        await marker
+
+    async def _writer_loop(self) -> None:
+        """Commit queued writes in batches of up to WRITE_BATCH_MAX_ROWS."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._write_queue.get()]
+            deadline = loop.time() + WRITE_BATCH_INTERVAL_SECONDS
+            while len(batch) < WRITE_BATCH_MAX_ROWS and not isinstance(batch[-1], asyncio.Future):
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._write_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._write_batch(batch)
+
+    async def _write_batch(self, batch: list[QueuedWrite | asyncio.Future]) -> None:
+        """Execute a batch of queued writes in one transaction and wake any flush waiters.
+
+        A failed batch is rolled back by _writer() and retried one write at a
+        time, so only the failing writes are lost and their error is kept for
+        the owning job's next flush() to raise.
+        """
+        writes = [item for item in batch if not isinstance(item, asyncio.Future)]
+        waiters = [item for item in batch if isinstance(item, asyncio.Future)]
+        try:
+            async with self._writer() as conn:
+                await self._execute_writes(conn, writes)
+        except Exception:
+            logger.warning("Database write batch of %d statements failed, retrying individually", len(writes))
+            await self._retry_writes(writes)
+        finally:
+            self._pending_writes -= len(writes)
+
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def _retry_writes(self, writes: list[QueuedWrite]) -> None:
+        """Commit writes one per transaction, recording the first failure per job."""
+        for job_id, sql, params in writes:
+            try:
+                async with self._writer() as conn:
+                    await conn.execute(sql, params)
+                    await conn.commit()
+            except Exception as e:
+                logger.exception("Database write for job %s failed", job_id)
+                self._write_errors.setdefault(job_id, e)
+
+    @staticmethod
+    async def _execute_writes(conn: aiosqlite.Connection, writes: list[QueuedWrite]) -> None:
+        """Run queued writes on the writer connection and commit them."""
+        # Group consecutive statements with the same SQL into one executemany
+        i = 0
+        while i < len(writes):
+            sql = writes[i][1]
+            j = i
+            while j < len(writes) and writes[j][1] == sql:
+                j += 1
+            await conn.executemany(sql, [params for _, _, params in writes[i:j]])
+            i = j
+        await conn.commit()
+
     @property
     def conn(self) -> aiosqlite.Connection:
-        """Get the database connection."""
+        """Get the writer connection."""
         if not self._connection:
             raise RuntimeError("Database not connected")
         return self._connection
 
+    @asynccontextmanager
+    async def _writer(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Hold the writer connection for one transaction, rolling it back on error."""
+        async with self._write_lock:
+            conn = self.conn
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+
+    @asynccontextmanager
+    async def _reader(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Borrow a read-only connection from the pool."""
+        if not self._reader_connections:
+            raise RuntimeError("Database not connected")
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+
+    async def _fetchall(self, sql: str, params: tuple = ()) -> list[aiosqlite.Row]:
+        """Run a query on a reader and fetch every row in a single worker-thread call."""
+        async with self._reader() as conn:
+            return list(await conn.execute_fetchall(sql, params))
+
+    @staticmethod
+    async def _executemany_chunked(conn: aiosqlite.Connection, sql: str, rows: Iterator[tuple]) -> None:
+        """Insert rows in chunks of BULK_INSERT_CHUNK_SIZE without materialising them all."""
+        while chunk := list(islice(rows, BULK_INSERT_CHUNK_SIZE)):
+            await conn.executemany(sql, chunk)
+
     # ========================================================================
     # Jobs
     # ========================================================================
@@ -155,14 +556,62 @@ class Database:
         config: dict[str, Any],
     ) -> None:
         """Create a new benchmark job."""
-        await self.conn.execute(
-            """
-            INSERT INTO jobs (id, chain_id, chain_name, status, config_json, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
-            (job_id, chain_id, chain_name, status, json.dumps(config), datetime.utcnow().isoformat()),
+        async with self._writer() as conn:
+            await conn.execute(
+                """
+                INSERT INTO jobs (id, chain_id, chain_name, status, config_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (job_id, chain_id, chain_name, status, _pack_json(config), datetime.utcnow().isoformat()),
+            )
+            await conn.commit()
+
+    async def upsert_job(
+        self,
+        job_id: str,
+        chain_id: int,
+        chain_name: str,
+        status: str,
+        config: dict[str, Any],
+        completed_at: datetime | None = None,
+        duration_seconds: float | None = None,
+        error_message: str | None = None,
+    ) -> None:
+        """Create a job, or update its status fields if it already exists, in one statement."""
+        await self._wait_for_writes()
+        async with self._writer() as conn:
+            await conn.execute(
+                UPSERT_JOB_SQL,
+                self._job_row(
+                    job_id, chain_id, chain_name, status, config,
+                    completed_at, duration_seconds, error_message,
+                ),
+            )
+            await conn.commit()
+
+    @staticmethod
+    def _job_row(
+        job_id: str,
+        chain_id: int,
+        chain_name: str,
+        status: str,
+        config: dict[str, Any],
+        completed_at: datetime | None = None,
+        duration_seconds: float | None = None,
+        error_message: str | None = None,
+    ) -> tuple:
+        """Build the UPSERT parameters for a job."""
+        return (
+            job_id,
+            chain_id,
+            chain_name,
+            status,
+            _pack_json(config),
+            datetime.utcnow().isoformat(),
+            completed_at.isoformat() if completed_at else None,
+            duration_seconds,
+            error_message,
         )
-        await self.conn.commit()
 
     async def update_job_status(
         self,
@@ -172,13 +621,14 @@ class Database:
         duration_seconds: float | None = None,
         error_message: str | None = None,
     ) -> None:
-        """Update job status."""
-        await self.conn.execute(
-            """
-            UPDATE jobs
-            SET status = ?, completed_at = ?, duration_seconds = ?, error_message = ?
-            WHERE id = ?
-            """,
+        """Update job status.
+
+        The update is queued on the write-behind writer. Terminal updates
+        (with ``completed_at``) wait until everything queued is committed.
+        """
+        await self._enqueue_write(
+            job_id,
+            UPDATE_JOB_STATUS_SQL,
             (
                 status,
                 completed_at.isoformat() if completed_at else None,
@@ -187,18 +637,18 @@ class Database:
                 job_id,
             ),
         )
-        await self.conn.commit()
+        if completed_at is not None:
+            await self.flush(job_id)
 
     async def get_job(self, job_id: str) -> dict[str, Any] | None:
         """Get a job by ID."""
-        async with self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return dict(row)
-        return None
+        await self._wait_for_writes()
+        rows = await self._fetchall("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        return self._job_from_row(rows[0]) if rows else None
 
     async def list_jobs(self, chain_id: int | None = None, limit: int = 100) -> list[dict[str, Any]]:
         """List all jobs, optionally filtered by chain."""
+        await self._wait_for_writes()
         if chain_id is not None:
             query = "SELECT * FROM jobs WHERE chain_id = ? ORDER BY created_at DESC LIMIT ?"
             params = (chain_id, limit)
@@ -206,40 +656,76 @@ class Database:
             query = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
             params = (limit,)
 
-        async with self.conn.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await self._fetchall(query, params)
+        return [self._job_from_row(row) for row in rows]
+
+    @staticmethod
+    def _job_from_row(row: aiosqlite.Row) -> dict[str, Any]:
+        """Convert a jobs row to a dict with the config JSON parsed."""
+        job = dict(row)
+        job["config"] = _unpack_json(job.pop("config_json") or "{}")
+        return job
 
     async def delete_job(self, job_id: str) -> bool:
         """Delete a job and all related data."""
-        cursor = await self.conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
-        await self.conn.commit()
-        return cursor.rowcount > 0
+        await self._wait_for_writes()
+        async with self._writer() as conn:
+            # Foreign keys are not enforced, so remove child rows explicitly
+            # through their job_id indexes rather than relying on ON DELETE CASCADE
+            for table in JOB_CHILD_TABLES:
+                await conn.execute(f"DELETE FROM {table} WHERE job_id = ?", (job_id,))
+            cursor = await conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+            await conn.commit()
+            return cursor.rowcount > 0
 
     # ========================================================================
     # Providers
     # ========================================================================
 
     async def add_job_provider(
-        self, job_id: str, provider_id: str, name: str, url: str, region: str | None
+        self,
+        job_id: str,
+        provider_id: str,
+        name: str,
+        url: str,
+        region: str | None,
+        url_hash: str | None = None,
     ) -> None:
         """Add a provider to a job."""
-        await self.conn.execute(
-            """
-            INSERT INTO job_providers (id, job_id, name, url, region)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (provider_id, job_id, name, url, region),
+        async with self._writer() as conn:
+            await conn.execute(
+                INSERT_JOB_PROVIDER_SQL,
+                (provider_id, job_id, name, url, url_hash or hash_url(url), region),
+            )
+            await conn.commit()
+
+    async def add_job_providers_bulk(self, job_id: str, providers: Iterable[dict[str, Any]]) -> None:
+        """Add many providers in one transaction.
+
+        Each provider is a dict with id, name, url, region and optionally url_hash.
+        """
+        async with self._writer() as conn:
+            await conn.executemany(
+                INSERT_JOB_PROVIDER_SQL, [self._job_provider_row(job_id, p) for p in providers]
+            )
+            await conn.commit()
+
+    @staticmethod
+    def _job_provider_row(job_id: str, provider: dict[str, Any]) -> tuple:
+        """Build the INSERT parameters for a job provider."""
+        return (
+            provider["id"],
+            job_id,
+            provider["name"],
+            provider["url"],
+            provider.get("url_hash") or hash_url(provider["url"]),
+            provider.get("region"),
         )
-        await self.conn.commit()
 
     async def get_job_providers(self, job_id: str) -> list[dict[str, Any]]:
         """Get all providers for a job."""
-        async with self.conn.execute(
-            "SELECT * FROM job_providers WHERE job_id = ?", (job_id,)
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        rows = await self._fetchall("SELECT * FROM job_providers WHERE job_id = ?", (job_id,))
+        return [dict(row) for row in rows]
 
     # ========================================================================
     # Test Parameters
@@ -247,24 +733,16 @@ class Database:
 
     async def save_job_test_params(self, job_id: str, params: dict[str, Any]) -> None:
         """Save test parameters for a job."""
-        await self.conn.execute(
-            """
-            INSERT OR REPLACE INTO job_test_params (job_id, params_json)
-            VALUES (?, ?)
-            """,
-            (job_id, json.dumps(params)),
-        )
-        await self.conn.commit()
+        async with self._writer() as conn:
+            await conn.execute(UPSERT_TEST_PARAMS_SQL, (job_id, _pack_json(params)))
+            await conn.commit()
 
     async def get_job_test_params(self, job_id: str) -> dict[str, Any] | None:
         """Get test parameters for a job."""
-        async with self.conn.execute(
+        rows = await self._fetchall(
             "SELECT params_json FROM job_test_params WHERE job_id = ?", (job_id,)
-        ) as cursor:
-            row = await cursor.fetchone()
-            if row:
-                return json.loads(row["params_json"])
-        return None
+        )
+        return _unpack_json(rows[0]["params_json"]) if rows else None
 
     # ========================================================================
     # Tests Executed
@@ -272,120 +750,179 @@ class Database:
 
     async def save_job_test_executed(self, job_id: str, test_id: int, test_data: dict[str, Any]) -> None:
         """Save a test that was executed."""
-        await self.conn.execute(
-            """
-            INSERT INTO job_tests_executed (job_id, test_id, test_json)
-            VALUES (?, ?, ?)
-            """,
-            (job_id, test_id, json.dumps(test_data)),
-        )
-        await self.conn.commit()
+        async with self._writer() as conn:
+            await conn.execute(
+                INSERT_TEST_EXECUTED_SQL,
+                (job_id, test_id, _pack_json(test_data)),
+            )
+            await conn.commit()
+
+    async def save_job_tests_executed_bulk(
+        self, job_id: str, tests: Iterable[tuple[int, dict[str, Any]]]
+    ) -> None:
+        """Save many executed tests, given as (test_id, test_data) pairs, in one transaction."""
+        async with self._writer() as conn:
+            await conn.executemany(
+                INSERT_TEST_EXECUTED_SQL,
+                [(job_id, test_id, _pack_json(test_data)) for test_id, test_data in tests],
+            )
+            await conn.commit()
 
     async def get_job_tests_executed(self, job_id: str) -> list[dict[str, Any]]:
         """Get all tests executed for a job."""
-        async with self.conn.execute(
+        rows = await self._fetchall(
             "SELECT test_json FROM job_tests_executed WHERE job_id = ? ORDER BY test_id",
             (job_id,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [json.loads(row["test_json"]) for row in rows]
+        )
+        size = sum(len(row["test_json"]) for row in rows)
+        return await map_offloaded(lambda row: _unpack_json(row["test_json"]), rows, size)
 
     # ========================================================================
     # Test Results
     # ========================================================================
 
     async def save_test_result(self, result: dict[str, Any]) -> None:
-        """Save a test result."""
-        await self.conn.execute(
-            """
-            INSERT INTO test_results (
-                job_id, provider_id, test_id, test_name, category, label,
-                iteration, iteration_type, response_time_ms, success,
-                error_type, error_message, http_status, response_size_bytes,
-                log_count, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                result["job_id"],
-                result["provider_id"],
-                result["test_id"],
-                result["test_name"],
-                result["category"],
-                result["label"],
-                result["iteration"],
-                result["iteration_type"],
-                result.get("response_time_ms"),
-                1 if result["success"] else 0,
-                result.get("error_type"),
-                result.get("error_message"),
-                result.get("http_status"),
-                result.get("response_size_bytes"),
-                result.get("log_count"),
-                result.get("timestamp", datetime.utcnow().isoformat()),
-            ),
+        """Queue a test result for the write-behind writer."""
+        await self._enqueue_write(result["job_id"], INSERT_TEST_RESULT_SQL, self._test_result_row(result))
+
+    async def save_test_results_bulk(self, results: Iterable[dict[str, Any]]) -> None:
+        """Save many test results in a single transaction.
+
+        Rows are consumed lazily in chunks, so a generator can be passed to
+        avoid materialising every row up front.
+        """
+        async with self._writer() as conn:
+            await self._executemany_chunked(conn, INSERT_TEST_RESULT_SQL, map(self._test_result_row, results))
+            await conn.commit()
+
+    @staticmethod
+    def _test_result_row(result: dict[str, Any]) -> tuple:
+        """Build the INSERT parameters for a test result."""
+        return (
+            *_test_result_fields(result),
+            CATEGORY_CODES[result["category"]],
+            LABEL_CODES[result["label"]],
+            result["iteration"],
+            ITERATION_TYPE_CODES[result["iteration_type"]],
+            result.get("response_time_ms"),
+            1 if result["success"] else 0,
+            _encode_error_type(result.get("error_type")),
+            result.get("error_message"),
+            result.get("http_status"),
+            result.get("response_size_bytes"),
+            result.get("log_count"),
+            result.get("timestamp") or datetime.utcnow().isoformat(),
         )
-        await self.conn.commit()
 
     async def get_test_results(self, job_id: str) -> list[dict[str, Any]]:
         """Get all test results for a job."""
-        async with self.conn.execute(
-            "SELECT * FROM test_results WHERE job_id = ? ORDER BY provider_id, test_id, iteration",
-            (job_id,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        return [r async for r in self.iter_test_results(job_id)]
+
+    async def iter_test_results(self, job_id: str) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream test results for a job without holding every row twice."""
+        await self._wait_for_writes()
+        async with self._reader() as conn:
+            async with conn.execute(
+                "SELECT * FROM test_results WHERE job_id = ? ORDER BY provider_id, test_id, iteration",
+                (job_id,),
+            ) as cursor:
+                while rows := await cursor.fetchmany(FETCH_CHUNK_SIZE):
+                    for row in rows:
+                        yield self._test_result_from_row(row)
+
+    @staticmethod
+    def _test_result_from_row(row: aiosqlite.Row) -> dict[str, Any]:
+        """Convert a test_results row to a dict with enum codes decoded."""
+        result = dict(row)
+        result["category"] = _category_names[result["category"]]
+        result["label"] = _label_names[result["label"]]
+        result["iteration_type"] = _iteration_type_names[result["iteration_type"]]
+        if result["error_type"] is not None:
+            result["error_type"] = _error_type_names[result["error_type"]]
+        return result
 
     # ========================================================================
     # Load Test Results
     # ========================================================================
 
     async def save_load_test_result(self, result: dict[str, Any]) -> None:
-        """Save a load test result."""
-        await self.conn.execute(
-            """
-            INSERT INTO load_test_results (
-                job_id, provider_id, test_id, test_name, method, concurrency,
-                total_time_ms, min_ms, max_ms, avg_ms, p50_ms, p95_ms, p99_ms,
-                success_count, error_count, success_rate, throughput_rps, errors_json, timestamp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                result["job_id"],
-                result["provider_id"],
-                result["test_id"],
-                result["test_name"],
-                result["method"],
-                result["concurrency"],
-                result["total_time_ms"],
-                result["min_ms"],
-                result["max_ms"],
-                result["avg_ms"],
-                result["p50_ms"],
-                result["p95_ms"],
-                result["p99_ms"],
-                result["success_count"],
-                result["error_count"],
-                result["success_rate"],
-                result["throughput_rps"],
-                json.dumps(result.get("errors", [])),
-                result.get("timestamp", datetime.utcnow().isoformat()),
-            ),
+        """Queue a load test result for the write-behind writer."""
+        await self._enqueue_write(
+            result["job_id"], INSERT_LOAD_TEST_RESULT_SQL, self._load_test_result_row(result)
+        )
+
+    async def save_load_test_results_bulk(self, results: Iterable[dict[str, Any]]) -> None:
+        """Save many load test results in a single transaction.
+
+        Rows are consumed lazily in chunks, so a generator can be passed to
+        avoid materialising every row up front.
+        """
+        async with self._writer() as conn:
+            await self._executemany_chunked(conn, INSERT_LOAD_TEST_RESULT_SQL, map(self._load_test_result_row, results))
+            await conn.commit()
+
+    @staticmethod
+    def _load_test_result_row(result: dict[str, Any]) -> tuple:
+        """Build the INSERT parameters for a load test result."""
+        return (
+            *_load_test_result_fields(result),
+            json_dumps(result.get("errors", [])),
+            result.get("timestamp") or datetime.utcnow().isoformat(),
         )
-        await self.conn.commit()
 
     async def get_load_test_results(self, job_id: str) -> list[dict[str, Any]]:
         """Get all load test results for a job."""
-        async with self.conn.execute(
+        await self._wait_for_writes()
+        rows = await self._fetchall(
             "SELECT * FROM load_test_results WHERE job_id = ? ORDER BY provider_id, test_id",
             (job_id,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-            results = []
-            for row in rows:
-                r = dict(row)
-                r["errors"] = json.loads(r.pop("errors_json") or "[]")
-                results.append(r)
-            return results
+        )
+        size = sum(len(row["errors_json"] or "") for row in rows)
+        return await map_offloaded(self._load_result_from_row, rows, size)
+
+    @staticmethod
+    def _load_result_from_row(row: aiosqlite.Row) -> dict[str, Any]:
+        """Convert a load_test_results row to a dict with the errors JSON parsed."""
+        result = dict(row)
+        result["errors"] = json_loads(result.pop("errors_json") or "[]")
+        return result
+
+    # ========================================================================
+    # Import
+    # ========================================================================
+
+    async def import_job(
+        self,
+        job: dict[str, Any],
+        providers: Iterable[dict[str, Any]],
+        test_params: dict[str, Any] | None,
+        tests_executed: Iterable[tuple[int, dict[str, Any]]],
+        results: Iterable[dict[str, Any]],
+        load_results: Iterable[dict[str, Any]],
+    ) -> None:
+        """Write an imported job and all of its rows in a single transaction.
+
+        ``job`` holds the upsert_job() arguments. Any failure rolls back the
+        whole import, so a bad file never leaves a partial job behind.
+        """
+        await self._wait_for_writes()
+        job_id = job["job_id"]
+        async with self._writer() as conn:
+            await conn.execute(UPSERT_JOB_SQL, self._job_row(**job))
+            await conn.executemany(
+                INSERT_JOB_PROVIDER_SQL, [self._job_provider_row(job_id, p) for p in providers]
+            )
+            if test_params:
+                await conn.execute(UPSERT_TEST_PARAMS_SQL, (job_id, _pack_json(test_params)))
+            await conn.executemany(
+                INSERT_TEST_EXECUTED_SQL,
+                [(job_id, test_id, _pack_json(test_data)) for test_id, test_data in tests_executed],
+            )
+            await self._executemany_chunked(conn, INSERT_TEST_RESULT_SQL, map(self._test_result_row, results))
+            await self._executemany_chunked(
+                conn, INSERT_LOAD_TEST_RESULT_SQL, map(self._load_test_result_row, load_results)
+            )
+            await conn.commit()
 
 
 # Global database instance
@@ -411,3 +948,11 @@ async def get_db_context() -> AsyncGenerator[Database, None]:
 async def init_db() -> None:
     """Initialize the database."""
     await get_db()
+
+
+async def close_db() -> None:
+    """Flush pending writes and close the database."""
+    global _db
+    if _db is not None:
+        await _db.disconnect()
+        _db = None
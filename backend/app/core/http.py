@@ -0,0 +1,67 @@
+"""Shared HTTP client for JSON-RPC requests."""
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - httpx needs it for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Connection pool sizing for the shared client
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS = 100
+
+# Per-provider benchmark clients, sized for the largest load test by default
+BENCHMARK_MAX_CONNECTIONS = 256
+BENCHMARK_KEEPALIVE_EXPIRY_SECONDS = 60
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create a pooled async HTTP client."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(15.0, connect=5.0),
+    )
+
+
+def create_benchmark_client(
+    timeout: float, max_connections: int = BENCHMARK_MAX_CONNECTIONS
+) -> httpx.AsyncClient:
+    """Create a keep-alive client for benchmarking a single provider.
+
+    HTTP/2 is negotiated when the optional h2 package is installed, letting
+    concurrent requests share a connection instead of opening one each.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_keepalive_connections=max_connections,
+            max_connections=max_connections,
+            keepalive_expiry=BENCHMARK_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(timeout),
+    )
+
+
+# Global client instance
+_client: httpx.AsyncClient | None = None
+
+
+def get_rpc_client() -> httpx.AsyncClient:
+    """Get the shared RPC client, creating it if needed."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _create_client()
+    return _client
+
+
+async def close_rpc_client() -> None:
+    """Close the shared RPC client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
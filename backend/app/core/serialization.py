@@ -0,0 +1,74 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import asyncio
+import json
+from functools import lru_cache
+from typing import Any, Callable, Sequence, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+# Payloads at least this large are parsed in a worker thread, off the event loop
+OFFLOAD_THRESHOLD_BYTES = 64 * 1024
+
+T = TypeVar("T")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=256)
+def _encode_rpc_without_params(method: str) -> bytes:
+    """Pre-serialized request body for a parameterless RPC method."""
+    return json_dumps_bytes({"jsonrpc": "2.0", "method": method, "params": [], "id": 1})
+
+
+def encode_rpc_request(method: str, params: list[Any] | None = None) -> bytes:
+    """Serialize a JSON-RPC request body (parameterless bodies are cached)."""
+    if not params:
+        return _encode_rpc_without_params(method)
+    return json_dumps_bytes({"jsonrpc": "2.0", "method": method, "params": params, "id": 1})
+
+
+def json_dumps_indented_bytes(obj: Any) -> bytes:
+    """Serialize an object to human-readable (2-space indented) UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+async def json_loads_async(data: bytes | str) -> Any:
+    """Parse JSON, in a worker thread when the payload is large."""
+    if len(data) < OFFLOAD_THRESHOLD_BYTES:
+        return json_loads(data)
+    return await asyncio.to_thread(json_loads, data)
+
+
+async def map_offloaded(convert: Callable[[Any], T], items: Sequence[Any], size: int) -> list[T]:
+    """Apply a (JSON-decoding) conversion to items, in a worker thread when size is large."""
+    if size < OFFLOAD_THRESHOLD_BYTES:
+        return [convert(item) for item in items]
+    return await asyncio.to_thread(lambda: [convert(item) for item in items])
@@ -11,8 +11,9 @@ from fastapi.staticfiles import StaticFiles
 
 from .api import router as api_router
 from .core.config import settings
-from .core.database import init_db
-from .services import ChainService
+from .core.database import close_db, init_db
+from .core.http import close_rpc_client, get_rpc_client
+from .services import chain_service
 
 
 @asynccontextmanager
@@ -29,13 +30,17 @@ async def lifespan(app: FastAPI):
     await init_db()
 
     # Load preset chains
-    chain_service = ChainService()
     chain_service.ensure_presets_loaded()
 
+    # Create the shared RPC client up front; routes fetch it with get_rpc_client()
+    get_rpc_client()
+
     yield
 
     # Shutdown
     print("Shutting down RPC Benchmarker")
+    await close_rpc_client()
+    await close_db()
 
 
 app = FastAPI(
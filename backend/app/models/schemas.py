@@ -1,5 +1,6 @@
 """Pydantic models for the RPC Benchmarker application."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Any
@@ -216,8 +217,9 @@ class BenchmarkConfig(BaseModel):
     """
     iteration_mode: IterationMode = IterationMode.STANDARD
     timeout_seconds: int = 30
-    delay_ms: int = 100  # Delay between individual requests
+    delay_ms: int = 100  # Interval between the starts of individual requests
     inter_round_delay_ms: int = 2000  # Delay between rounds (allows cache propagation)
+    max_parallel_providers: int = Field(default=10, ge=1)  # Providers run concurrently per round
     categories: list[TestCategory] = Field(
         default_factory=lambda: [TestCategory.SIMPLE, TestCategory.MEDIUM, TestCategory.COMPLEX, TestCategory.LOAD]
     )
@@ -377,7 +379,8 @@ class LogCountComparison(BaseModel):
 # SSE Events
 # ============================================================================
 
-class SSEEvent(BaseModel):
+@dataclass(slots=True)
+class SSEEvent:
     """Server-Sent Event."""
     event: str
     data: dict[str, Any]
@@ -1,9 +1,10 @@
-from .chain_service import ChainService
+from .chain_service import ChainService, chain_service
 from .benchmark_service import BenchmarkService
 from .test_definitions import get_test_definitions, build_test_cases
 
 __all__ = [
     "ChainService",
+    "chain_service",
     "BenchmarkService",
     "get_test_definitions",
     "build_test_cases",
@@ -1,7 +1,11 @@
 """Benchmark execution service."""
 
 import asyncio
-import json
+import itertools
+import logging
+import math
+import operator
+import re
 import statistics
 import time
 import uuid
@@ -11,6 +15,8 @@ from typing import Any, AsyncGenerator
 import httpx
 
 from ..core.database import get_db
+from ..core.http import create_benchmark_client
+from ..core.serialization import encode_rpc_request, json_loads
 from ..models import (
     BenchmarkConfig,
     BenchmarkJob,
@@ -25,15 +31,66 @@ from ..models import (
 from .chain_service import chain_service
 from .test_definitions import build_test_cases
 
+logger = logging.getLogger(__name__)
+
 # eth_getLogs can take a long time for large block ranges
 GETLOGS_TIMEOUT_SECONDS = 300  # 5 minutes
 
+# Concurrency for load tests that do not specify one
+DEFAULT_LOAD_CONCURRENCY = 50
+
+# Timings are taken with integer perf_counter_ns() and converted to ms once
+NS_PER_MS = 1_000_000
+
+# Headers for JSON-RPC requests sent with a pre-encoded body
+RPC_HEADERS = {"Content-Type": "application/json"}
+
+
+# RPC error classification rules, checked in order (first match wins).
+# Each rule matches a JSON-RPC error code or a pattern in the lowercased message.
+RPC_ERROR_RULES: tuple[tuple[ErrorCategory, frozenset[int], re.Pattern[str]], ...] = (
+    # Execution reverted (parameter error - wrong contract/data)
+    (ErrorCategory.EXECUTION_REVERTED, frozenset(), re.compile(r"revert")),
+    # Invalid params (parameter error)
+    (ErrorCategory.INVALID_PARAMS, frozenset({-32602}), re.compile(r"invalid argument|invalid param")),
+    # Method not supported (provider limitation)
+    (ErrorCategory.UNSUPPORTED, frozenset({-32601}), re.compile(r"not supported|not found|does not exist")),
+    # Block range limit (provider limitation, but fixable by user); "limit" only counts alongside "log"
+    (
+        ErrorCategory.BLOCK_RANGE_LIMIT,
+        frozenset(),
+        re.compile(r"block range|too many|exceeds|limit.*log|log.*limit", re.DOTALL),
+    ),
+    # Resource exhaustion (provider issue)
+    (ErrorCategory.RATE_LIMIT, frozenset(), re.compile(r"resource|memory")),
+)
+
+
+def _percentile(sorted_times: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_times[min(int(len(sorted_times) * fraction), len(sorted_times) - 1)]
+
+
+def _median(sorted_times: list[float]) -> float:
+    """Median of an already sorted list (statistics.median would sort it again)."""
+    mid = len(sorted_times) // 2
+    if len(sorted_times) % 2:
+        return sorted_times[mid]
+    return (sorted_times[mid - 1] + sorted_times[mid]) / 2
+
+
+def _stdev(times: list[float], mean: float) -> float:
+    """Sample standard deviation in float arithmetic (statistics.stdev is exact but slow)."""
+    if len(times) < 2:
+        return 0
+    return math.sqrt(math.fsum((t - mean) ** 2 for t in times) / (len(times) - 1))
+
 
 class BenchmarkService:
     """Service for running RPC benchmarks."""
 
     def __init__(self):
-        self._running_jobs: dict[str, bool] = {}  # job_id -> cancelled flag
+        self._running_jobs: dict[str, asyncio.Event] = {}  # job_id -> cancellation event
 
     async def create_job(
         self,
@@ -82,14 +139,7 @@ class BenchmarkService:
         )
 
         # Save providers
-        for provider in provider_objects:
-            await db.add_job_provider(
-                job_id=job.id,
-                provider_id=provider.id,
-                name=provider.name,
-                url=provider.url,
-                region=provider.region,
-            )
+        await db.add_job_providers_bulk(job.id, (p.model_dump() for p in provider_objects))
 
         # Save test params
         await db.save_job_test_params(
@@ -109,25 +159,39 @@ class BenchmarkService:
             yield SSEEvent(event="error", data={"message": f"Job {job_id} not found"})
             return
 
-        # Parse config
-        config_data = job_data["config_json"]
-        if isinstance(config_data, str):
-            config_data = json.loads(config_data)
-        config = BenchmarkConfig(**config_data)
+        config = BenchmarkConfig(**job_data["config"])
 
         # Get providers
         providers_data = await db.get_job_providers(job_id)
-        providers = [Provider(**p) for p in providers_data]
+        # Rows were validated on insert, so skip re-validation
+        providers = [Provider.model_construct(**p) for p in providers_data]
+
+        # One keep-alive client per provider, reused for every call in the job and
+        # with enough connections that the largest load test never waits on the pool.
+        # Keyed by provider id, since several providers may share a URL.
+        peak_concurrency = max(
+            config.load_concurrency_simple,
+            config.load_concurrency_medium,
+            config.load_concurrency_complex,
+            DEFAULT_LOAD_CONCURRENCY,
+        )
+        clients = {
+            p.id: create_benchmark_client(config.timeout_seconds, max_connections=peak_concurrency)
+            for p in providers
+        }
 
         # Mark job as running
-        self._running_jobs[job_id] = False  # Not cancelled
+        cancelled = asyncio.Event()
+        self._running_jobs[job_id] = cancelled
         await db.update_job_status(job_id, JobStatus.RUNNING.value)
 
         start_time = time.time()
 
         try:
             # Get current block number (use first provider)
-            current_block = await self._get_current_block(providers[0].url, config.timeout_seconds)
+            current_block = await self._get_current_block(
+                clients[providers[0].id], providers[0].url, config.timeout_seconds
+            )
 
             # Build test cases
             test_cases = build_test_cases(
@@ -141,23 +205,43 @@ class BenchmarkService:
                 },
             )
 
-            # Filter by categories and labels
-            test_cases = [
-                tc for tc in test_cases
-                if tc.category in config.categories and tc.label in config.labels
-            ]
-
-            # Save tests executed
+            # Filter by categories and labels, separating sequential and load tests in the same pass
+            categories = frozenset(config.categories)
+            labels = frozenset(config.labels)
+            selected_tests: list[TestCase] = []
+            sequential_tests: list[TestCase] = []
+            load_tests: list[TestCase] = []
             for tc in test_cases:
-                await db.save_job_test_executed(
-                    job_id=job_id,
-                    test_id=tc.id,
-                    test_data=tc.model_dump(mode="json"),
-                )
+                if tc.category not in categories or tc.label not in labels:
+                    continue
+                selected_tests.append(tc)
+                (load_tests if tc.category == TestCategory.LOAD else sequential_tests).append(tc)
+            test_cases = selected_tests
+
+            # Request bodies never change during a job, so encode each test's once
+            request_bodies = {tc.id: encode_rpc_request(tc.rpc_method, tc.rpc_params) for tc in test_cases}
+
+            # getLogs gets a longer timeout; resolved once per test rather than per call
+            test_timeouts = {
+                tc.id: GETLOGS_TIMEOUT_SECONDS if tc.rpc_method == "eth_getLogs" else config.timeout_seconds
+                for tc in test_cases
+            }
+
+            # Per-test result fields that are the same for every provider and round
+            test_fields = {
+                tc.id: {
+                    "test_id": tc.id,
+                    "test_name": tc.name,
+                    "category": tc.category.value,
+                    "label": tc.label.value,
+                }
+                for tc in test_cases
+            }
 
-            # Separate sequential and load tests
-            sequential_tests = [tc for tc in test_cases if tc.category != TestCategory.LOAD]
-            load_tests = [tc for tc in test_cases if tc.category == TestCategory.LOAD]
+            # Save tests executed
+            await db.save_job_tests_executed_bulk(
+                job_id, ((tc.id, tc.model_dump(mode="json")) for tc in test_cases)
+            )
 
             rounds = config.get_round_count()
             total_tests = len(sequential_tests) * len(providers) + len(load_tests) * len(providers)
@@ -168,6 +252,7 @@ class BenchmarkService:
             total_load_units = len(load_tests) * len(providers)
             total_work_units = total_sequential_units + total_load_units
             completed_units = 0
+            progress_per_unit = 1 / total_work_units if total_work_units > 0 else 0
 
             # Emit job started
             yield SSEEvent(
@@ -183,11 +268,17 @@ class BenchmarkService:
                 },
             )
 
+            # Bound once for the per-iteration loop below
+            save_test_result = db.save_test_result
+
+            # Limits how many providers run their round at the same time
+            provider_slots = asyncio.Semaphore(config.max_parallel_providers)
+
             # Run sequential tests in ROUNDS
             # Round 1 = cold (cache miss expected)
             # Round 2+ = warm (cache hit expected after propagation delay)
             for round_num in range(rounds):
-                if self._running_jobs.get(job_id):
+                if cancelled.is_set():
                     break  # Cancelled
 
                 iteration_type = IterationType.COLD if round_num == 0 else IterationType.WARM
@@ -201,32 +292,40 @@ class BenchmarkService:
                     },
                 )
 
-                # Run each test once per round, cycling through all providers
-                for provider in providers:
-                    if self._running_jobs.get(job_id):
-                        break
-
-                    for test in sequential_tests:
-                        if self._running_jobs.get(job_id):
-                            break
-
-                        # Use longer timeout for getLogs
-                        timeout = GETLOGS_TIMEOUT_SECONDS if test.rpc_method == "eth_getLogs" else config.timeout_seconds
-                        result = await self._execute_rpc_call(
-                            provider.url,
-                            test.rpc_method,
-                            test.rpc_params,
-                            timeout,
+                # Run each test once per round. Providers are independent endpoints with
+                # their own connections, so they run concurrently; each keeps its own
+                # test order and delays, and reports results back through a queue.
+                results_queue: asyncio.Queue[tuple[Provider, TestCase, dict[str, Any]] | None] = asyncio.Queue()
+                workers = [
+                    asyncio.create_task(
+                        self._run_sequential_for_provider(
+                            provider,
+                            clients[provider.id],
+                            sequential_tests,
+                            request_bodies,
+                            test_timeouts,
+                            config.delay_ms,
+                            cancelled,
+                            provider_slots,
+                            results_queue,
                         )
+                    )
+                    for provider in providers
+                ]
+                try:
+                    remaining = len(workers)
+                    while remaining:
+                        item = await results_queue.get()
+                        if item is None:
+                            remaining -= 1  # A provider finished this round
+                            continue
+                        provider, test, result = item
 
                         # Save result
                         test_result = {
                             "job_id": job_id,
                             "provider_id": provider.id,
-                            "test_id": test.id,
-                            "test_name": test.name,
-                            "category": test.category.value,
-                            "label": test.label.value,
+                            **test_fields[test.id],
                             "iteration": round_num + 1,  # Round number as iteration
                             "iteration_type": iteration_type.value,
                             "response_time_ms": result.get("response_time_ms"),
@@ -237,11 +336,11 @@ class BenchmarkService:
                             "response_size_bytes": result.get("response_size_bytes"),
                             "log_count": result.get("log_count"),  # For eth_getLogs tests
                         }
-                        await db.save_test_result(test_result)
+                        await save_test_result(test_result)
 
                         # Update progress
                         completed_units += 1
-                        progress = completed_units / total_work_units if total_work_units > 0 else 0
+                        progress = completed_units * progress_per_unit
 
                         yield SSEEvent(
                             event="iteration_complete",
@@ -260,9 +359,12 @@ class BenchmarkService:
                             },
                         )
 
-                        # Small delay between individual requests
-                        if config.delay_ms > 0:
-                            await asyncio.sleep(config.delay_ms / 1000)
+                    # Surface any worker failure as a job failure
+                    await asyncio.gather(*workers)
+                finally:
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
 
                 # Inter-round delay to allow cache propagation (except after last round)
                 if round_num < rounds - 1:
@@ -275,7 +377,7 @@ class BenchmarkService:
                         },
                     )
                     if config.inter_round_delay_ms > 0:
-                        await asyncio.sleep(config.inter_round_delay_ms / 1000)
+                        await self._sleep_unless_cancelled(config.inter_round_delay_ms / 1000, cancelled)
 
             yield SSEEvent(
                 event="sequential_complete",
@@ -284,11 +386,11 @@ class BenchmarkService:
 
             # Run load tests (one provider at a time)
             for provider in providers:
-                if self._running_jobs.get(job_id):
+                if cancelled.is_set():
                     break
 
                 for test in load_tests:
-                    if self._running_jobs.get(job_id):
+                    if cancelled.is_set():
                         break
 
                     yield SSEEvent(
@@ -302,15 +404,20 @@ class BenchmarkService:
                         },
                     )
 
-                    # Run concurrent requests (use longer timeout for getLogs)
-                    load_timeout = GETLOGS_TIMEOUT_SECONDS if test.rpc_method == "eth_getLogs" else config.timeout_seconds
-                    load_result = await self._execute_load_test(
-                        provider.url,
-                        test.rpc_method,
-                        test.rpc_params,
-                        test.concurrency or 50,
-                        load_timeout,
+                    # Run concurrent requests
+                    load_result = await self._unless_cancelled(
+                        self._execute_load_test(
+                            clients[provider.id],
+                            provider.url,
+                            test.rpc_method,
+                            request_bodies[test.id],
+                            test.concurrency or DEFAULT_LOAD_CONCURRENCY,
+                            test_timeouts[test.id],
+                        ),
+                        cancelled,
                     )
+                    if load_result is None:
+                        break  # Cancelled mid-test
 
                     # Save load test result
                     load_test_result = {
@@ -319,14 +426,14 @@ class BenchmarkService:
                         "test_id": test.id,
                         "test_name": test.name,
                         "method": test.rpc_method,
-                        "concurrency": test.concurrency or 50,
+                        "concurrency": test.concurrency or DEFAULT_LOAD_CONCURRENCY,
                         **load_result,
                     }
                     await db.save_load_test_result(load_test_result)
 
                     # Update progress
                     completed_units += 1
-                    progress = completed_units / total_work_units if total_work_units > 0 else 0
+                    progress = completed_units * progress_per_unit
 
                     yield SSEEvent(
                         event="load_test_complete",
@@ -343,11 +450,11 @@ class BenchmarkService:
                     )
 
                     # Cooldown between load tests
-                    await asyncio.sleep(2)
+                    await self._sleep_unless_cancelled(2, cancelled)
 
             # Mark job as completed
             duration = time.time() - start_time
-            status = JobStatus.CANCELLED if self._running_jobs.get(job_id) else JobStatus.COMPLETED
+            status = JobStatus.CANCELLED if cancelled.is_set() else JobStatus.COMPLETED
 
             await db.update_job_status(
                 job_id=job_id,
@@ -378,15 +485,109 @@ class BenchmarkService:
             )
 
         finally:
+            # Make sure queued results are committed even after a failure or disconnect
+            try:
+                await db.flush(job_id)
+            except Exception:
+                logger.exception("Failed to commit queued results for job %s", job_id)
+            await asyncio.gather(*(client.aclose() for client in clients.values()))
             self._running_jobs.pop(job_id, None)
 
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job."""
-        if job_id in self._running_jobs:
-            self._running_jobs[job_id] = True
+        cancelled = self._running_jobs.get(job_id)
+        if cancelled is not None:
+            cancelled.set()
             return True
         return False
 
+    async def _run_sequential_for_provider(
+        self,
+        provider: Provider,
+        client: httpx.AsyncClient,
+        tests: list[TestCase],
+        request_bodies: dict[int, bytes],
+        test_timeouts: dict[int, float],
+        delay_ms: int,
+        cancelled: asyncio.Event,
+        provider_slots: asyncio.Semaphore,
+        results_queue: asyncio.Queue,
+    ) -> None:
+        """Run one round of sequential tests against a provider.
+
+        Each (provider, test, result) is put on the queue, followed by None when done.
+        """
+        try:
+            async with provider_slots:
+                await self._run_provider_round(
+                    provider, client, tests, request_bodies, test_timeouts, delay_ms, cancelled, results_queue
+                )
+        finally:
+            results_queue.put_nowait(None)
+
+    async def _run_provider_round(
+        self,
+        provider: Provider,
+        client: httpx.AsyncClient,
+        tests: list[TestCase],
+        request_bodies: dict[int, bytes],
+        test_timeouts: dict[int, float],
+        delay_ms: int,
+        cancelled: asyncio.Event,
+        results_queue: asyncio.Queue,
+    ) -> None:
+        """Run a provider's sequential tests in order, on the delay_ms schedule."""
+        # Requests start on a fixed schedule, so RPC time is not added on top of the delay
+        period = delay_ms / 1000
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        for test in tests:
+            if cancelled.is_set():
+                break
+
+            result = await self._unless_cancelled(
+                self._execute_rpc_call(
+                    client,
+                    provider.url,
+                    test.rpc_method,
+                    request_bodies[test.id],
+                    test_timeouts[test.id],
+                ),
+                cancelled,
+            )
+            if result is None:
+                break  # Cancelled mid-call
+            results_queue.put_nowait((provider, test, result))
+
+            # Wait for the next slot; a slow call pushes the schedule back rather
+            # than triggering a catch-up burst
+            if period > 0:
+                now = loop.time()
+                deadline = max(deadline + period, now)
+                if deadline > now:
+                    await self._sleep_unless_cancelled(deadline - now, cancelled)
+
+    @staticmethod
+    async def _unless_cancelled(coro: Any, cancelled: asyncio.Event) -> Any:
+        """Await a coroutine, abandoning it (and returning None) as soon as the job is cancelled."""
+        task = asyncio.ensure_future(coro)
+        waiter = asyncio.ensure_future(cancelled.wait())
+        try:
+            done, _ = await asyncio.wait({task, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+            if not task.done():
+                task.cancel()
+        return task.result() if task in done else None
+
+    @staticmethod
+    async def _sleep_unless_cancelled(seconds: float, cancelled: asyncio.Event) -> None:
+        """Sleep, waking early if the job is cancelled."""
+        try:
+            await asyncio.wait_for(cancelled.wait(), seconds)
+        except asyncio.TimeoutError:
+            pass
+
     async def get_job(self, job_id: str) -> dict[str, Any] | None:
         """Get a job by ID with all related data."""
         db = await get_db()
@@ -445,16 +646,15 @@ class BenchmarkService:
             "test_params": test_params,
         }
 
-    async def _get_current_block(self, url: str, timeout: int) -> int:
+    async def _get_current_block(self, client: httpx.AsyncClient, url: str, timeout: int) -> int:
         """Get current block number from provider."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json={"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1},
-                timeout=timeout,
-            )
-            result = response.json()
-            return int(result["result"], 16)
+        response = await client.post(
+            url,
+            json={"jsonrpc": "2.0", "method": "eth_blockNumber", "params": [], "id": 1},
+            timeout=timeout,
+        )
+        result = json_loads(response.content)
+        return int(result["result"], 16)
 
     def _classify_rpc_error(self, error_obj: dict[str, Any], method: str) -> ErrorCategory:
         """Classify an RPC error into a category.
@@ -466,131 +666,115 @@ class BenchmarkService:
         error_code = error_obj.get("code", 0)
         error_msg = error_obj.get("message", "").lower()
 
-        # Check for execution reverted (parameter error - wrong contract/data)
-        if "execution reverted" in error_msg or "revert" in error_msg:
-            return ErrorCategory.EXECUTION_REVERTED
-
-        # Check for invalid params (parameter error)
-        if error_code == -32602 or "invalid argument" in error_msg or "invalid param" in error_msg:
-            return ErrorCategory.INVALID_PARAMS
-
-        # Check for method not supported (provider limitation)
-        if (error_code == -32601 or "not supported" in error_msg or
-            "not found" in error_msg or "method not found" in error_msg or
-            "does not exist" in error_msg):
-            return ErrorCategory.UNSUPPORTED
-
-        # Check for block range limit (provider limitation, but fixable by user)
-        if ("block range" in error_msg or "too many" in error_msg or
-            "exceeds" in error_msg or "limit" in error_msg and "log" in error_msg):
-            return ErrorCategory.BLOCK_RANGE_LIMIT
-
-        # Check for resource exhaustion (provider issue)
-        if "resource" in error_msg or "memory" in error_msg:
-            return ErrorCategory.RATE_LIMIT
+        for category, codes, pattern in RPC_ERROR_RULES:
+            if error_code in codes or pattern.search(error_msg):
+                return category
 
         # Default to generic RPC error
         return ErrorCategory.RPC_ERROR
 
     async def _execute_rpc_call(
         self,
+        client: httpx.AsyncClient,
         url: str,
         method: str,
-        params: list[Any],
+        body: bytes,
         timeout: int,
+        collect_details: bool = True,
     ) -> dict[str, Any]:
-        """Execute a single RPC call and return timing results with error classification."""
-        async with httpx.AsyncClient() as client:
-            start = time.perf_counter()
-            try:
-                response = await client.post(
-                    url,
-                    json={"jsonrpc": "2.0", "method": method, "params": params, "id": 1},
-                    timeout=timeout,
-                )
-                elapsed = (time.perf_counter() - start) * 1000  # ms
-
-                # Rate limit (provider error)
-                if response.status_code == 429:
-                    return {
-                        "success": False,
-                        "error_type": ErrorCategory.RATE_LIMIT.value,
-                        "error_is_provider_fault": True,
-                        "http_status": 429,
-                        "response_time_ms": elapsed,
-                    }
+        """Execute a single RPC call and return timing results with error classification.
 
-                result = response.json()
-                if "error" in result:
-                    error_category = self._classify_rpc_error(result["error"], method)
-                    is_provider_fault = ErrorCategory.is_provider_error(error_category)
-                    return {
-                        "success": False,
-                        "error_type": error_category.value,
-                        "error_is_provider_fault": is_provider_fault,
-                        "error_message": result["error"].get("message", ""),
-                        "http_status": response.status_code,
-                        "response_time_ms": elapsed,
-                    }
-
-                # For eth_getLogs, extract the log count for data consistency tracking
-                log_count = None
-                if method == "eth_getLogs" and "result" in result:
-                    logs = result["result"]
-                    if isinstance(logs, list):
-                        log_count = len(logs)
-
-                return {
-                    "success": True,
-                    "response_time_ms": elapsed,
-                    "http_status": response.status_code,
-                    "response_size_bytes": len(response.content),
-                    "log_count": log_count,
-                }
+        Load tests pass collect_details=False to skip the response size and log count.
+        """
+        start = time.perf_counter_ns()
+        try:
+            response = await client.post(url, content=body, headers=RPC_HEADERS, timeout=timeout)
+            elapsed = (time.perf_counter_ns() - start) / NS_PER_MS
 
-            except httpx.TimeoutException:
-                elapsed = (time.perf_counter() - start) * 1000
+            # Rate limit (provider error)
+            if response.status_code == 429:
                 return {
                     "success": False,
-                    "error_type": ErrorCategory.TIMEOUT.value,
+                    "error_type": ErrorCategory.RATE_LIMIT.value,
                     "error_is_provider_fault": True,
+                    "http_status": 429,
                     "response_time_ms": elapsed,
                 }
-            except httpx.ConnectError:
-                return {
-                    "success": False,
-                    "error_type": ErrorCategory.CONNECTION.value,
-                    "error_is_provider_fault": True,
-                }
-            except Exception as e:
+
+            result = json_loads(response.content)
+            if "error" in result:
+                error_category = self._classify_rpc_error(result["error"], method)
+                is_provider_fault = ErrorCategory.is_provider_error(error_category)
                 return {
                     "success": False,
-                    "error_type": ErrorCategory.UNKNOWN.value,
-                    "error_is_provider_fault": False,
-                    "error_message": str(e),
+                    "error_type": error_category.value,
+                    "error_is_provider_fault": is_provider_fault,
+                    "error_message": result["error"].get("message", ""),
+                    "http_status": response.status_code,
+                    "response_time_ms": elapsed,
                 }
 
+            if not collect_details:
+                return {"success": True, "response_time_ms": elapsed}
+
+            # For eth_getLogs, extract the log count for data consistency tracking
+            log_count = None
+            if method == "eth_getLogs" and "result" in result:
+                logs = result["result"]
+                if isinstance(logs, list):
+                    log_count = len(logs)
+
+            return {
+                "success": True,
+                "response_time_ms": elapsed,
+                "http_status": response.status_code,
+                "response_size_bytes": len(response.content),
+                "log_count": log_count,
+            }
+
+        except httpx.TimeoutException:
+            elapsed = (time.perf_counter_ns() - start) / NS_PER_MS
+            return {
+                "success": False,
+                "error_type": ErrorCategory.TIMEOUT.value,
+                "error_is_provider_fault": True,
+                "response_time_ms": elapsed,
+            }
+        except httpx.ConnectError:
+            return {
+                "success": False,
+                "error_type": ErrorCategory.CONNECTION.value,
+                "error_is_provider_fault": True,
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error_type": ErrorCategory.UNKNOWN.value,
+                "error_is_provider_fault": False,
+                "error_message": str(e),
+            }
+
     async def _execute_load_test(
         self,
+        client: httpx.AsyncClient,
         url: str,
         method: str,
-        params: list[Any],
+        body: bytes,
         concurrency: int,
         timeout: int,
     ) -> dict[str, Any]:
-        """Execute a load test with concurrent requests."""
-        start_time = time.perf_counter()
+        """Execute a load test with concurrent requests sharing one encoded body."""
+        start_time = time.perf_counter_ns()
 
         # Create tasks for concurrent execution
-        async with httpx.AsyncClient() as client:
-            tasks = []
-            for _ in range(concurrency):
-                task = self._timed_rpc_call(client, url, method, params, timeout)
-                tasks.append(task)
+        tasks = []
+        for _ in range(concurrency):
+            task = self._execute_rpc_call(client, url, method, body, timeout, collect_details=False)
+            tasks.append(task)
 
-            results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*tasks)
 
-        total_time = (time.perf_counter() - start_time) * 1000  # ms
+        total_time = (time.perf_counter_ns() - start_time) / NS_PER_MS
 
         # Analyze results with detailed error tracking
         times = []
@@ -603,8 +787,9 @@ class BenchmarkService:
         for r in results:
             if r["success"]:
                 success_count += 1
-                if r.get("response_time_ms"):
-                    times.append(r["response_time_ms"])
+                response_time_ms = r.get("response_time_ms")
+                if response_time_ms is not None:
+                    times.append(response_time_ms)
             else:
                 error_count += 1
                 error_type = r.get("error_type", "unknown")
@@ -618,15 +803,14 @@ class BenchmarkService:
 
         # Calculate statistics
         if times:
-            times_sorted = sorted(times)
-            min_ms = times_sorted[0]
-            max_ms = times_sorted[-1]
-            avg_ms = statistics.mean(times)
-            p50_ms = times_sorted[len(times) // 2]
-            p95_idx = int(len(times) * 0.95)
-            p95_ms = times_sorted[min(p95_idx, len(times) - 1)]
-            p99_idx = int(len(times) * 0.99)
-            p99_ms = times_sorted[min(p99_idx, len(times) - 1)]
+            # One in-place sort serves min/max and every percentile
+            times.sort()
+            min_ms = times[0]
+            max_ms = times[-1]
+            avg_ms = statistics.fmean(times)
+            p50_ms = _percentile(times, 0.50)
+            p95_ms = _percentile(times, 0.95)
+            p99_ms = _percentile(times, 0.99)
         else:
             min_ms = max_ms = avg_ms = p50_ms = p95_ms = p99_ms = 0
 
@@ -650,118 +834,68 @@ class BenchmarkService:
             "error_breakdown": error_breakdown,
         }
 
-    async def _timed_rpc_call(
-        self,
-        client: httpx.AsyncClient,
-        url: str,
-        method: str,
-        params: list[Any],
-        timeout: int,
-    ) -> dict[str, Any]:
-        """Execute a timed RPC call with error classification."""
-        start = time.perf_counter()
-        try:
-            response = await client.post(
-                url,
-                json={"jsonrpc": "2.0", "method": method, "params": params, "id": 1},
-                timeout=timeout,
-            )
-            elapsed = (time.perf_counter() - start) * 1000
-
-            if response.status_code == 429:
-                return {
-                    "success": False,
-                    "error_type": ErrorCategory.RATE_LIMIT.value,
-                    "error_is_provider_fault": True,
-                    "response_time_ms": elapsed,
-                }
-
-            result = response.json()
-            if "error" in result:
-                error_category = self._classify_rpc_error(result["error"], method)
-                return {
-                    "success": False,
-                    "error_type": error_category.value,
-                    "error_is_provider_fault": ErrorCategory.is_provider_error(error_category),
-                    "response_time_ms": elapsed,
-                }
-
-            return {"success": True, "response_time_ms": elapsed}
-
-        except httpx.TimeoutException:
-            return {
-                "success": False,
-                "error_type": ErrorCategory.TIMEOUT.value,
-                "error_is_provider_fault": True,
-            }
-        except Exception:
-            return {
-                "success": False,
-                "error_type": ErrorCategory.UNKNOWN.value,
-                "error_is_provider_fault": False,
-            }
-
     def _compute_aggregated_results(
         self, test_results: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Compute aggregated results from individual test results with error analysis."""
-        # Group by provider and test
-        groups: dict[tuple[str, int], list[dict]] = {}
-        for r in test_results:
-            key = (r["provider_id"], r["test_id"])
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(r)
+        """Compute aggregated results from individual test results with error analysis.
 
+        Results must be ordered by provider and test, as returned by get_test_results.
+        """
         aggregated = []
-        for (provider_id, test_id), results in groups.items():
-            if not results:
-                continue
-
+        for (provider_id, test_id), group in itertools.groupby(
+            test_results, key=operator.itemgetter("provider_id", "test_id")
+        ):
+            results = list(group)
             first = results[0]
-            successful = [r for r in results if r["success"]]
-            failed = [r for r in results if not r["success"]]
-            times = [r["response_time_ms"] for r in successful if r.get("response_time_ms")]
 
-            # Error analysis
+            # Single pass over the group: timings, cold/warm split, errors
+            success_count = 0
+            times: list[float] = []
+            warm_times: list[float] = []
+            cold_result = None
+            log_count = None
             error_breakdown: dict[str, int] = {}
-            error_messages: list[str] = []
+            error_messages: dict[str, None] = {}  # Unique messages, in first-seen order
             provider_errors = 0
             param_errors = 0
-            for r in failed:
+            for r in results:
+                iteration_type = r["iteration_type"]
+                if cold_result is None and iteration_type == "cold":
+                    cold_result = r
+
+                if r["success"]:
+                    success_count += 1
+                    elapsed = r.get("response_time_ms")
+                    if elapsed is not None:
+                        times.append(elapsed)
+                        if iteration_type in ("warm", "sustained"):
+                            warm_times.append(elapsed)
+                    # log_count from the first successful result that has it (getLogs tests)
+                    if log_count is None:
+                        log_count = r.get("log_count")
+                    continue
+
                 error_type = r.get("error_type", "unknown")
                 error_breakdown[error_type] = error_breakdown.get(error_type, 0) + 1
 
-                # Collect unique error messages
                 error_msg = r.get("error_message")
-                if error_msg and error_msg not in error_messages:
-                    error_messages.append(error_msg)
+                if error_msg:
+                    error_messages[error_msg] = None
 
-                # Classify fault
-                if error_type in ("timeout", "rate_limit", "connection", "unsupported"):
-                    provider_errors += 1
-                elif error_type in ("invalid_params", "execution_reverted", "block_range_limit"):
+                # Classify fault; unknown/rpc_error count as provider unless we know otherwise
+                if error_type in ("invalid_params", "execution_reverted", "block_range_limit"):
                     param_errors += 1
                 else:
-                    # For unknown/rpc_error, count as provider unless we know otherwise
                     provider_errors += 1
 
-            # Get cold and warm times
-            cold_result = next((r for r in results if r["iteration_type"] == "cold"), None)
-            warm_results = [r for r in results if r["iteration_type"] in ("warm", "sustained") and r["success"]]
+            error_count = len(results) - success_count
 
-            cold_ms = cold_result["response_time_ms"] if cold_result and cold_result.get("response_time_ms") else 0
-            warm_ms = statistics.mean([r["response_time_ms"] for r in warm_results if r.get("response_time_ms")]) if warm_results else cold_ms
+            cold_elapsed = cold_result.get("response_time_ms") if cold_result else None
+            cold_ms = cold_elapsed if cold_elapsed is not None else 0
+            warm_ms = statistics.fmean(warm_times) if warm_times else cold_ms
 
             cache_speedup = cold_ms / warm_ms if warm_ms > 0 else 1.0
 
-            # Get log_count from first successful result that has it (for getLogs tests)
-            log_count = None
-            for r in successful:
-                if r.get("log_count") is not None:
-                    log_count = r["log_count"]
-                    break
-
             agg = {
                 "provider_id": provider_id,
                 "test_id": test_id,
@@ -769,9 +903,9 @@ class BenchmarkService:
                 "category": first["category"],
                 "label": first["label"],
                 "count": len(results),
-                "success_count": len(successful),
-                "error_count": len(failed),
-                "success_rate": len(successful) / len(results) if results else 0,
+                "success_count": success_count,
+                "error_count": error_count,
+                "success_rate": success_count / len(results),
                 "cold_ms": cold_ms,
                 "warm_ms": warm_ms,
                 "cache_speedup": cache_speedup,
@@ -780,22 +914,23 @@ class BenchmarkService:
                 "provider_errors": provider_errors,
                 "param_errors": param_errors,
                 "error_breakdown": error_breakdown,
-                "error_messages": error_messages[:5],  # Limit to first 5 unique messages
+                "error_messages": list(error_messages)[:5],  # Limit to first 5 unique messages
             }
 
             # Extended metrics (when enough samples)
             if len(times) >= 5:
-                agg["mean_ms"] = statistics.mean(times)
-                agg["median_ms"] = statistics.median(times)
-                agg["min_ms"] = min(times)
-                agg["max_ms"] = max(times)
-                agg["std_dev_ms"] = statistics.stdev(times) if len(times) > 1 else 0
+                times.sort()
+                mean_ms = statistics.fmean(times)
+                agg["mean_ms"] = mean_ms
+                agg["median_ms"] = _median(times)
+                agg["min_ms"] = times[0]
+                agg["max_ms"] = times[-1]
+                agg["std_dev_ms"] = _stdev(times, mean_ms)
 
             # Statistical metrics
             if len(times) >= 25:
-                sorted_times = sorted(times)
-                agg["p90_ms"] = sorted_times[int(len(times) * 0.90)]
-                agg["p95_ms"] = sorted_times[int(len(times) * 0.95)]
+                agg["p90_ms"] = _percentile(times, 0.90)
+                agg["p95_ms"] = _percentile(times, 0.95)
 
             aggregated.append(agg)
 
@@ -811,29 +946,22 @@ class BenchmarkService:
         This helps identify data consistency issues where providers return
         different numbers of logs for the same query.
         """
-        from collections import Counter
-
         # Filter to only getLogs tests with log_count data
         getLogs_results = [
             r for r in test_results
             if r.get("log_count") is not None or (
-                "getLogs" in r.get("test_name", "") and r.get("success")
+                r.get("success") and "getLogs" in r.get("test_name", "")
             )
         ]
 
-        if not getLogs_results:
-            return []
-
-        # Group by test_id and iteration (round)
-        groups: dict[tuple[int, int], list[dict]] = {}
-        for r in getLogs_results:
-            key = (r["test_id"], r["iteration"])
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(r)
+        # Group by test_id and iteration (round); the stable sort keeps providers in row order
+        # and leaves the comparisons already ordered by test_id, then round_number
+        group_key = operator.itemgetter("test_id", "iteration")
+        getLogs_results.sort(key=group_key)
 
         comparisons = []
-        for (test_id, iteration), results in groups.items():
+        for (test_id, iteration), group in itertools.groupby(getLogs_results, key=group_key):
+            results = list(group)
             if len(results) < 2:
                 # Need at least 2 providers to compare
                 continue
@@ -843,24 +971,18 @@ class BenchmarkService:
             # Build provider counts dict (provider_name -> log_count)
             provider_counts: dict[str, int | None] = {}
             for r in results:
-                pname = provider_names.get(r["provider_id"], r["provider_id"])
-                provider_counts[pname] = r.get("log_count")
+                provider_id = r["provider_id"]
+                provider_counts[provider_names.get(provider_id, provider_id)] = r.get("log_count")
 
-            # Find consensus (most common non-None count)
+            # Find consensus (most common non-None count, earliest on ties); groups hold one
+            # count per provider, so counting in place beats building a Counter
             valid_counts = [c for c in provider_counts.values() if c is not None]
             if valid_counts:
-                count_frequency = Counter(valid_counts)
-                consensus_count = count_frequency.most_common(1)[0][0]
+                consensus_count = max(valid_counts, key=valid_counts.count)
+                has_mismatch = min(valid_counts) != max(valid_counts)
             else:
                 consensus_count = None
-
-            # Check for mismatches
-            has_mismatch = False
-            if consensus_count is not None:
-                for count in valid_counts:
-                    if count != consensus_count:
-                        has_mismatch = True
-                        break
+                has_mismatch = False
 
             comparisons.append({
                 "test_id": test_id,
@@ -871,9 +993,6 @@ class BenchmarkService:
                 "has_mismatch": has_mismatch,
             })
 
-        # Sort by test_id, then round_number
-        comparisons.sort(key=lambda x: (x["test_id"], x["round_number"]))
-
         return comparisons
 
 
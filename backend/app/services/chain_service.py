@@ -1,11 +1,12 @@
 """Chain configuration management service."""
 
-import json
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from ..core.config import settings
+from ..core.serialization import json_dumps_bytes, json_dumps_indented_bytes, json_loads
 from ..models import ChainConfig
 
 
@@ -15,9 +16,15 @@ class ChainService:
     def __init__(self):
         self.chains_dir = settings.chains_dir
         self.presets_dir = Path(__file__).parent.parent.parent / "presets" / "chains"
+        # Serialized list_chains() output, keyed by the chain files' signature
+        self._chains_json: tuple[frozenset[tuple[str, int, int]], bytes] | None = None
+        self._chain_cache: dict[Path, tuple[int, ChainConfig]] = {}  # path -> (mtime_ns, parsed chain)
+        self._presets_loaded = False
 
     def ensure_presets_loaded(self) -> None:
         """Ensure preset chain configs are copied to user data directory."""
+        if self._presets_loaded:
+            return
         settings.ensure_data_dir()
 
         # Copy presets if they don't exist
@@ -26,35 +33,73 @@ class ChainService:
                 target_file = self.chains_dir / preset_file.name
                 if not target_file.exists():
                     shutil.copy(preset_file, target_file)
+        self._presets_loaded = True
+
+    def _load_chain_file(self, chain_file: Path) -> ChainConfig | None:
+        """Load a chain config file, re-parsing only if it changed since last read."""
+        try:
+            mtime_ns = chain_file.stat().st_mtime_ns
+            cached = self._chain_cache.get(chain_file)
+            if cached is None or cached[0] != mtime_ns:
+                cached = (mtime_ns, ChainConfig(**json_loads(chain_file.read_bytes())))
+                self._chain_cache[chain_file] = cached
+        except Exception:
+            # Missing or invalid chain file
+            self._chain_cache.pop(chain_file, None)
+            return None
+        return cached[1]
+
+    def _iter_chains(self) -> Iterator[ChainConfig]:
+        """Yield every valid chain config."""
+        self.ensure_presets_loaded()
+
+        for chain_file in self.chains_dir.glob("*.json"):
+            chain = self._load_chain_file(chain_file)
+            if chain is not None:
+                yield chain
 
     def list_chains(self) -> list[ChainConfig]:
         """List all available chain configurations."""
-        self.ensure_presets_loaded()
-        chains = []
+        return sorted(self._iter_chains(), key=lambda c: c.chain_id)
 
+    def _chains_signature(self) -> frozenset[tuple[str, int, int]]:
+        """Name, mtime and size of every chain file, to detect changes made on disk."""
+        signature = set()
         for chain_file in self.chains_dir.glob("*.json"):
             try:
-                with open(chain_file) as f:
-                    data = json.load(f)
-                    chains.append(ChainConfig(**data))
-            except Exception:
-                # Skip invalid chain files
+                stat = chain_file.stat()
+            except OSError:
                 continue
+            signature.add((chain_file.name, stat.st_mtime_ns, stat.st_size))
+        return frozenset(signature)
 
-        return sorted(chains, key=lambda c: c.chain_id)
+    def list_chains_json(self) -> bytes:
+        """List all chain configurations as serialized JSON.
+
+        The result is cached until a chain file is added, removed or modified,
+        whether through this service or directly on disk.
+        """
+        self.ensure_presets_loaded()
+        signature = self._chains_signature()
+        if self._chains_json is None or self._chains_json[0] != signature:
+            self._chains_json = (
+                signature,
+                json_dumps_bytes([c.model_dump(mode="json") for c in self.list_chains()]),
+            )
+        return self._chains_json[1]
 
     def get_chain(self, chain_id: int) -> ChainConfig | None:
         """Get a chain configuration by ID."""
         self.ensure_presets_loaded()
 
-        for chain_file in self.chains_dir.glob("*.json"):
-            try:
-                with open(chain_file) as f:
-                    data = json.load(f)
-                    if data.get("chain_id") == chain_id:
-                        return ChainConfig(**data)
-            except Exception:
-                continue
+        # Custom chains are saved under a predictable name, so try that file first
+        chain = self._load_chain_file(self.chains_dir / f"custom_{chain_id}.json")
+        if chain is not None and chain.chain_id == chain_id:
+            return chain
+
+        for chain in self._iter_chains():
+            if chain.chain_id == chain_id:
+                return chain
 
         return None
 
@@ -70,8 +115,9 @@ class ChainService:
 
         filepath = self.chains_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(chain.model_dump(mode="json"), f, indent=2, default=str)
+        filepath.write_bytes(json_dumps_indented_bytes(chain.model_dump(mode="json")))
+        self._chain_cache.pop(filepath, None)
+        self._chains_json = None
 
     def delete_chain(self, chain_id: int) -> bool:
         """Delete a custom chain configuration. Returns False if preset."""
@@ -85,6 +131,8 @@ class ChainService:
         # Find and delete the file
         for chain_file in self.chains_dir.glob(f"custom_{chain_id}.json"):
             chain_file.unlink()
+            self._chain_cache.pop(chain_file, None)
+            self._chains_json = None
             return True
 
         return False
@@ -5,13 +5,18 @@ Removed: balanceOf (needs ERC20+holder), getTransaction* (needs tx hash),
 getStorageAt (needs storage layout), trace/debug (often unsupported + needs tx).
 """
 
+from functools import lru_cache
 from typing import Any
 
 from ..models import TestCase, TestCategory, TestLabel, TestParams
 
 
+@lru_cache(maxsize=1)
 def get_test_definitions() -> list[dict[str, Any]]:
-    """Get the base test definitions (without parameters filled in)."""
+    """Get the base test definitions (without parameters filled in).
+
+    Built once and shared between callers, so treat the result as read-only.
+    """
     return [
         # Simple Tests (1-5) - No or minimal params required
         {
@@ -170,11 +175,6 @@ def get_test_definitions() -> list[dict[str, Any]]:
 TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
 
 
-def _to_hex(value: int) -> str:
-    """Convert integer to hex string."""
-    return hex(value)
-
-
 def build_test_cases(
     params: TestParams,
     current_block: int,
@@ -183,6 +183,9 @@ def build_test_cases(
 ) -> list[TestCase]:
     """Build test cases with filled-in parameters."""
     definitions = get_test_definitions()
+    if enabled_ids is not None:
+        enabled = frozenset(enabled_ids)
+        definitions = [defn for defn in definitions if defn["id"] in enabled]
     test_cases = []
 
     # Calculate derived values
@@ -198,19 +201,19 @@ def build_test_cases(
     logs_archival_end_small = logs_archival_start + params.logs_range_small
     logs_archival_end_large = logs_archival_start + params.logs_range_large
 
-    # Build substitution map (simplified - removed unused params)
+    # Build substitution map (simplified - removed unused params); hex() gives the 0x-prefixed form RPC expects
     subs = {
         "known_address": params.known_address,
-        "archival_block_hex": _to_hex(archival_block),
-        "recent_block_hex": _to_hex(recent_block),
+        "archival_block_hex": hex(archival_block),
+        "recent_block_hex": hex(recent_block),
         "logs_token_contract": params.logs_token_contract,
         "transfer_topic": TRANSFER_TOPIC,
-        "logs_recent_start_hex": _to_hex(logs_recent_start_small),
-        "logs_recent_start_large_hex": _to_hex(logs_recent_start_large),
-        "logs_recent_end_hex": _to_hex(logs_recent_end),
-        "logs_archival_start_hex": _to_hex(logs_archival_start),
-        "logs_archival_end_small_hex": _to_hex(logs_archival_end_small),
-        "logs_archival_end_large_hex": _to_hex(logs_archival_end_large),
+        "logs_recent_start_hex": hex(logs_recent_start_small),
+        "logs_recent_start_large_hex": hex(logs_recent_start_large),
+        "logs_recent_end_hex": hex(logs_recent_end),
+        "logs_archival_start_hex": hex(logs_archival_start),
+        "logs_archival_end_small_hex": hex(logs_archival_end_small),
+        "logs_archival_end_large_hex": hex(logs_archival_end_large),
     }
 
     load_conc = load_concurrency or {"simple": 50, "medium": 50, "complex": 25}
@@ -226,12 +229,9 @@ def build_test_cases(
     for defn in definitions:
         test_id = defn["id"]
 
-        # Check if enabled
-        if enabled_ids is not None and test_id not in enabled_ids:
-            continue
-
-        # Substitute parameters
-        rpc_params = _substitute_params(defn["param_template"], subs)
+        # Substitute parameters (parameterless methods get their own empty list)
+        template = defn["param_template"]
+        rpc_params = _substitute_params(template, subs) if template else []
 
         # Build test name - include actual block range for getLogs tests
         test_name = defn["name"]
@@ -242,10 +242,8 @@ def build_test_cases(
             from_block, to_block = block_ranges[test_id]
             block_count = to_block - from_block
             # Format: "eth_getLogs [12000000→12050000] (archival)"
-            if "small range" in test_name:
-                test_name = test_name.replace("small range", f"[{from_block:,}→{to_block:,}]")
-            elif "large range" in test_name:
-                test_name = test_name.replace("large range", f"[{from_block:,}→{to_block:,}]")
+            if range_size:
+                test_name = test_name.replace(f"{range_size} range", f"[{from_block:,}→{to_block:,}]", 1)
 
         # Determine concurrency for load tests
         concurrency = None
@@ -253,7 +251,8 @@ def build_test_cases(
             tier = defn.get("load_tier", "simple")
             concurrency = load_conc.get(tier, 50)
 
-        test_case = TestCase(
+        # Built from static definitions with typed values, so skip validation
+        test_case = TestCase.model_construct(
             id=test_id,
             name=test_name,
             category=TestCategory(defn["category"]),
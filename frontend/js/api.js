@@ -160,6 +160,11 @@ class ApiClient {
             onEvent({ event: 'load_test_complete', data: JSON.parse(event.data) });
         });
 
+        // Sent when progress events were coalesced away for a slow client
+        eventSource.addEventListener('events_dropped', (event) => {
+            onEvent({ event: 'events_dropped', data: JSON.parse(event.data) });
+        });
+
         eventSource.addEventListener('job_complete', (event) => {
             onEvent({ event: 'job_complete', data: JSON.parse(event.data) });
             eventSource.close();
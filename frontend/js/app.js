@@ -952,7 +952,15 @@ function handleProgressEvent(event) {
             const iterProgress = event.data.progress || 0;
             elements.progressBar.style.width = `${iterProgress * 100}%`;
             elements.progressStatus.textContent = `${Math.round(iterProgress * 100)}% - Round ${event.data.round}/${event.data.total_rounds} (${event.data.iteration_type})`;
-            log.textContent = `  ${event.data.provider_name}: ${event.data.test_name} - ${formatMs(event.data.response_time_ms)} ${event.data.success ? '✓' : '✗'}`;
+            // Coalesced frames carry every result since the previous frame
+            const iterResults = event.data.results || [event.data];
+            iterResults.slice(0, -1).forEach(r => appendProgressLog(formatIterationResult(r)));
+            log.textContent = formatIterationResult(iterResults[iterResults.length - 1]);
+            break;
+
+        case 'events_dropped':
+            log.textContent = `  ${event.data.count} results not shown (connection fell behind; they are still saved)`;
+            log.style.color = '#f59e0b';
             break;
 
         case 'load_test_start':
@@ -994,6 +1002,17 @@ function handleProgressEvent(event) {
     elements.progressDetails.scrollTop = elements.progressDetails.scrollHeight;
 }
 
+function formatIterationResult(result) {
+    return `  ${result.provider_name}: ${result.test_name} - ${formatMs(result.response_time_ms)} ${result.success ? '✓' : '✗'}`;
+}
+
+function appendProgressLog(text) {
+    const log = document.createElement('div');
+    log.className = 'progress-log';
+    log.textContent = text;
+    elements.progressDetails.appendChild(log);
+}
+
 function handleProgressError(error) {
     elements.progressStatus.textContent = 'Connection lost';
     console.error('SSE error:', error);